@@ -1,8 +1,9 @@
 import streamlit as st
-import time
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from utils import extract_text_from_pdf, clean_text, extract_skills, predict_category, get_static_interview_prep, calculate_ats_score
+from utils import PDFExtractionError, extract_resume_text, clean_text, predict_category, get_static_interview_prep, analyze_match
+from job_match import rank_jobs
+from text_cache import file_digest
+from pdf_extract import MAX_PDF_PAGES, MAX_TEXT_CHARS
+import metrics
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -129,35 +130,54 @@ with col1:
 with col2:
     st.markdown("### 💼 Job Description")
     job_description = st.text_area("Paste JD here...", height=200, label_visibility="collapsed")
+    job_files = st.file_uploader("Or compare against many roles (one .txt JD per file)", type=["txt", "md"],
+                                 accept_multiple_files=True)
+
+# Shown when a size cap in pdf_extract cut the resume text short
+TRUNCATION_WARNINGS = {
+    'pages': f"⚠️ Your resume is longer than {MAX_PDF_PAGES} pages; only the first {MAX_PDF_PAGES} were analysed.",
+    'chars': f"⚠️ Your resume has more than {MAX_TEXT_CHARS:,} characters of text; only the first {MAX_TEXT_CHARS:,} were analysed.",
+}
+
+# --- CACHED ANALYSIS ---
+# Keyed on the resume bytes hash and the normalised JD hash only; the leading
+# underscore tells Streamlit not to hash the file object and JD text again.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def run_analysis(resume_digest, jd_digest, _uploaded_file, _clean_jd):
+    # Only runs on a cache miss, so hits = analysis_requests_total - this counter
+    metrics.incr('analysis_computed_total')
+    resume_text, clean_resume, truncated = extract_resume_text(_uploaded_file)
+    analysis = analyze_match(resume_text, clean_resume, _clean_jd)
+    analysis['predicted_category'] = predict_category(clean_resume, cleaned=True)
+    analysis['truncated'] = truncated
+    return analysis
 
 if st.button("Analyze Match Compatibility"):
     if uploaded_file and job_description:
         with st.spinner("🔍 Scanning resume against job description..."):
-            time.sleep(1)
-            
             # --- LOGIC ---
-            resume_text = extract_text_from_pdf(uploaded_file)
-            clean_resume = clean_text(resume_text)
+            metrics.incr('analysis_requests_total')
             clean_jd = clean_text(job_description)
-            
-            predicted_category = predict_category(clean_resume)
-            
-            text_corpus = [clean_resume, clean_jd]
-            vectorizer = TfidfVectorizer()
-            tfidf_matrix = vectorizer.fit_transform(text_corpus)
-            match_percentage = round(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0] * 100, 2)
-            
-            resume_skills = set(extract_skills(clean_resume))
-            jd_skills = set(extract_skills(clean_jd))
-            missing_skills = list(jd_skills - resume_skills)
-            matching_skills = list(resume_skills.intersection(jd_skills))
+            try:
+                with metrics.timer('app_analysis'):
+                    analysis = run_analysis(file_digest(uploaded_file.getvalue()), file_digest(clean_jd.encode('utf-8')),
+                                            uploaded_file, clean_jd)
+            except PDFExtractionError as e:
+                st.error(f"❌ Could not read your resume: {e}")
+                st.stop()
 
-            # Calculate ATS Score
-            ats_score, ats_breakdown = calculate_ats_score(resume_text, missing_skills, clean_jd)
+            predicted_category = analysis['predicted_category']
+            match_percentage = analysis['match_percentage']
+            ats_score = analysis['ats_score']
+            ats_breakdown = analysis['ats_breakdown']
+            matching_skills = analysis['matching_skills']
+            missing_skills = analysis['missing_skills']
 
         # --- RESULTS DASHBOARD ---
         st.markdown("---")
         st.subheader("🎯 Analysis Results")
+        if analysis['truncated']:
+            st.warning(TRUNCATION_WARNINGS[analysis['truncated']])
         
         # 4 Columns for Stats
         m_col1, m_col2, m_col3, m_col4 = st.columns(4)
@@ -242,4 +262,35 @@ if st.button("Analyze Match Compatibility"):
             st.markdown(advice.replace("### 🎓 Customized Interview Prep", ""))
 
     else:
-        st.error("Please upload a PDF resume and paste the Job Description to start.")
\ No newline at end of file
+        st.error("Please upload a PDF resume and paste the Job Description to start.")
+
+if job_files and st.button("Rank Open Roles"):
+    if uploaded_file:
+        with st.spinner(f"🔍 Scoring your resume against {len(job_files)} roles..."):
+            metrics.incr('role_ranking_requests_total')
+            try:
+                resume_text, clean_resume, truncated = extract_resume_text(uploaded_file)
+            except PDFExtractionError as e:
+                st.error(f"❌ Could not read your resume: {e}")
+                st.stop()
+            jobs = [(f.name, f.getvalue().decode('utf-8', errors='replace')) for f in job_files]
+            with metrics.timer('app_role_ranking'):
+                ranked = rank_jobs(resume_text, jobs, clean_resume)
+
+        st.markdown("---")
+        st.subheader("🏆 Best-Fit Roles")
+        if truncated:
+            st.warning(TRUNCATION_WARNINGS[truncated])
+        st.dataframe(
+            [{
+                'Role': r['id'],
+                'ATS Score': r['ats_score'],
+                'JD Match %': r['match_percentage'],
+                'Matching Skills': len(r['matching_skills']),
+                'Missing Skills': ', '.join(r['missing_skills']) or '-',
+            } for r in ranked],
+            use_container_width=True,
+            hide_index=True,
+        )
+    else:
+        st.error("Please upload a PDF resume to rank roles.")
@@ -0,0 +1,143 @@
+"""
+Headless batch scoring: rank a directory or CSV of resumes against one job description.
+
+    python batch.py jd.txt data/UpdatedResumeDataSet.csv --top-k 20
+"""
+import argparse
+import csv
+import heapq
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import PDFExtractionError, extract_resume_text, clean_text, extract_features, analyze_match, predict_categories
+
+# Set once per worker process by _init_worker, so the JD is not pickled with every task
+_JOB = {}
+
+
+def iter_resumes(source, text_column='Resume'):
+    """
+    Yields (resume_id, payload) pairs. For a directory the payload is a PDF path,
+    for a CSV it is the resume text itself.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith('.pdf'):
+                yield name, os.path.join(source, name)
+    else:
+        csv.field_size_limit(sys.maxsize)
+        with open(source, newline='', encoding='utf-8', errors='replace') as f:
+            for row_number, row in enumerate(csv.DictReader(f)):
+                yield str(row_number), row[text_column]
+
+
+def _init_worker(job_description):
+    clean_jd = clean_text(job_description)
+    _JOB['clean_jd'] = clean_jd
+    _JOB['jd_features'] = extract_features(clean_jd, clean_jd)
+
+
+def _score_chunk(chunk):
+    scored = [_score(resume_id, payload) for resume_id, payload in chunk]
+    # One vectorised classifier call per chunk instead of one per resume
+    categories, _ = predict_categories([clean_resume for _, clean_resume in scored], cleaned=True)
+    results = []
+    for (result, _), category in zip(scored, categories):
+        result['category'] = category
+        results.append(result)
+    return results
+
+
+def score_resume(resume_id, payload):
+    """
+    Runs the app's analysis pipeline for one resume against the worker's JD.
+    """
+    return _score_chunk([(resume_id, payload)])[0]
+
+
+def _score(resume_id, payload):
+    if payload.lower().endswith('.pdf') and os.path.isfile(payload):
+        try:
+            resume_text, clean_resume, truncated = extract_resume_text(payload)
+        except PDFExtractionError as e:
+            # Unreadable resumes rank last instead of being scored as text
+            return {'id': resume_id, 'ats_score': 0, 'match_percentage': 0.0, 'matching_skills': [],
+                    'missing_skills': sorted(_JOB['jd_features'].skills), 'ats_breakdown': [], 'error': e.reason,
+                    'truncated': None}, ''
+    else:
+        resume_text = payload
+        clean_resume = clean_text(resume_text)
+        truncated = None
+    result = {'id': resume_id}
+    result.update(analyze_match(resume_text, clean_resume, _JOB['clean_jd'], _JOB['jd_features']))
+    result['error'] = None
+    # Set when a PDF size cap cut the text short, so the score only covers part of it
+    result['truncated'] = truncated
+    return result, clean_resume
+
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _rank_key(result):
+    return (result['ats_score'], result['match_percentage'])
+
+
+def rank_resumes(job_description, resumes, top_k=10, workers=None, chunksize=64):
+    """
+    Scores every (resume_id, payload) in `resumes` across a process pool and
+    returns the top_k results, best first. Chunks keep IPC overhead per resume low.
+    """
+    if isinstance(resumes, str):
+        resumes = iter_resumes(resumes)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(job_description)
+        results = (r for chunk in _chunks(resumes, chunksize) for r in _score_chunk(chunk))
+        return heapq.nlargest(top_k, results, key=_rank_key)
+
+    best = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(job_description,)) as pool:
+        for scored in pool.map(_score_chunk, _chunks(resumes, chunksize)):
+            best = heapq.nlargest(top_k, best + scored, key=_rank_key)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank resumes against a job description.")
+    parser.add_argument('jd', help="Path to a text file with the job description")
+    parser.add_argument('source', help="Directory of PDF resumes or a CSV with a 'Resume' column")
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--chunksize', type=int, default=64)
+    parser.add_argument('--json', action='store_true', help="Print full results as JSON")
+    args = parser.parse_args(argv)
+
+    with open(args.jd, encoding='utf-8') as f:
+        job_description = f.read()
+
+    results = rank_resumes(job_description, args.source, top_k=args.top_k,
+                           workers=args.workers, chunksize=args.chunksize)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:>3}. {result['id']:<30} {result['category']:<25} ATS {result['ats_score']:>3}  "
+              f"Match {result['match_percentage']:>6}%  Missing: {', '.join(result['missing_skills']) or '-'}"
+              + (f"  [truncated: {result['truncated']} limit]" if result['truncated'] else ''))
+
+
+if __name__ == '__main__':
+    main()
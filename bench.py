@@ -0,0 +1,271 @@
+"""
+Benchmarks each stage of the analysis pipeline and saves the results as JSON.
+
+    python bench.py --out bench_results.json
+    python bench.py --out new.json --compare bench_results.json   # exit 1 on regression
+
+Resume texts come from data/UpdatedResumeDataSet.csv; PDFs of several sizes are
+generated on the fly so PDF parsing is measured without any fixtures.
+"""
+import argparse
+import csv
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+import models
+from utils import (extract_text_from_pdf, clean_text, extract_skills, predict_category,
+                   calculate_ats_score, calculate_match_percentage)
+
+DEFAULT_JD = (
+    "We are hiring a backend engineer with strong Python and SQL skills. Experience with "
+    "Django or Flask, REST API design, Docker, Kubernetes and AWS is required. Familiarity "
+    "with machine learning, pandas and CI/CD (Jenkins, GitHub Actions) is a plus."
+)
+PDF_SIZES = (1, 5, 20)  # pages
+
+
+def make_pdf(text, pages, lines_per_page=45, chars_per_line=90):
+    """
+    Writes a minimal text-only PDF using just the standard library.
+    """
+    words = text.split() or ['resume']
+    line_words = max(1, chars_per_line // 7)
+    objects = []
+    page_ids = []
+    cursor = 0
+    for _ in range(pages):
+        lines = []
+        for _ in range(lines_per_page):
+            chunk = [words[(cursor + i) % len(words)] for i in range(line_words)]
+            cursor += line_words
+            line = ' '.join(chunk).encode('latin-1', 'replace').decode('latin-1')
+            lines.append(line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)'))
+        content = 'BT /F1 10 Tf 40 800 Td 14 TL ' + ' '.join(f'({line}) Tj T*' for line in lines) + ' ET'
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+        content_id = len(objects) + 2
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+                       f'/Contents {content_id} 0 R /Resources << /Font << /F1 {{font}} 0 R >> >> >>')
+        page_ids.append(len(objects) + 2)
+
+    font_id = len(objects) + 3
+    kids = ' '.join(f'{i} 0 R' for i in page_ids)
+    body = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {pages} >>',
+    ] + [obj.replace('{font}', str(font_id)) for obj in objects] + [
+        '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(body, 1):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n{obj}\nendobj\n'.encode('latin-1'))
+    xref = out.tell()
+    out.write(f'xref\n0 {len(body) + 1}\n0000000000 65535 f \n'.encode('latin-1'))
+    for offset in offsets:
+        out.write(f'{offset:010d} 00000 n \n'.encode('latin-1'))
+    out.write(f'trailer\n<< /Size {len(body) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1'))
+    return out.getvalue()
+
+
+def load_resumes(csv_path, sample, seed):
+    csv.field_size_limit(sys.maxsize)
+    with open(csv_path, newline='', encoding='utf-8', errors='replace') as f:
+        texts = [row['Resume'] for row in csv.DictReader(f)]
+    random.Random(seed).shuffle(texts)
+    return texts[:sample]
+
+
+def time_stage(fn, inputs, repeat=1):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in inputs:
+            t = time.perf_counter()
+            fn(item)
+            latencies.append((time.perf_counter() - t) * 1000)
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def peak_memory(fn, inputs):
+    tracemalloc.start()
+    for item in inputs:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def summarise(latencies, elapsed, peak_bytes, extra=None):
+    summary = {
+        'calls': len(latencies),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 4),
+        'p95_ms': round(float(np.percentile(latencies, 95)), 4),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 4),
+        'mean_ms': round(float(np.mean(latencies)), 4),
+        'throughput_per_sec': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'peak_memory_kb': round(peak_bytes / 1024, 1),
+    }
+    summary.update(extra or {})
+    return summary
+
+
+def run(csv_path, sample=200, repeat=3, seed=0, jd=DEFAULT_JD):
+    raw = load_resumes(csv_path, sample, seed)
+    clean = [clean_text(t) for t in raw]
+    clean_jd = clean_text(jd)
+    jd_skills = extract_skills(clean_jd)
+    # Without a classifier predict_category only returns its fallback label, so
+    # timing it would report a stage that did no work
+    classify = models.get_model('classifier') is not None
+    # Warm up lazy model loading and regex compilation outside the timed region
+    if classify:
+        predict_category(clean[0], cleaned=True)
+    calculate_match_percentage(clean[0], clean_jd)
+
+    resume_skills = [set(extract_skills(c)) for c in clean]
+    missing = [sorted(set(jd_skills) - s) for s in resume_skills]
+
+    stages = {
+        'clean_text': (clean_text, raw),
+        'extract_skills': (extract_skills, clean),
+        'predict_category': (lambda c: predict_category(c, cleaned=True), clean),
+        'calculate_ats_score': (lambda i: calculate_ats_score(raw[i], missing[i], clean_jd), range(len(raw))),
+        'tfidf_similarity': (lambda c: calculate_match_percentage(c, clean_jd), clean),
+    }
+    if not classify:
+        del stages['predict_category']
+
+    results = {}
+    for name, (fn, inputs) in stages.items():
+        inputs = list(inputs)
+        latencies, elapsed = time_stage(fn, inputs, repeat)
+        results[name] = summarise(latencies, elapsed, peak_memory(fn, inputs[:50]))
+
+    pdf_source = ' '.join(raw[:20])
+    for pages in PDF_SIZES:
+        pdf = make_pdf(pdf_source, pages)
+        docs = [pdf] * max(3, repeat * 5 // pages)
+        fn = lambda data: extract_text_from_pdf(io.BytesIO(data))
+        latencies, elapsed = time_stage(fn, docs)
+        results[f'extract_text_from_pdf[{pages}p]'] = summarise(
+            latencies, elapsed, peak_memory(fn, docs[:1]), {'pdf_bytes': len(pdf)})
+
+    def full_pipeline(i):
+        c = clean_text(raw[i])
+        skills = set(extract_skills(c))
+        if classify:
+            predict_category(c, cleaned=True)
+        calculate_match_percentage(c, clean_jd)
+        calculate_ats_score(raw[i], sorted(set(jd_skills) - skills), clean_jd)
+
+    latencies, elapsed = time_stage(full_pipeline, range(len(raw)))
+    results['pipeline_text'] = summarise(latencies, elapsed, peak_memory(full_pipeline, range(min(50, len(raw)))),
+                                         {'includes_classifier': classify})
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'model_errors': model_errors(),
+    }
+
+
+def model_errors():
+    """
+    Load error per model artifact, None for those that loaded. Stages that need a
+    missing artifact are skipped or flagged in the report.
+    """
+    errors = {}
+    for name in models.ARTIFACTS:
+        models.get_model(name)
+        errors[name] = models.load_error(name)
+    return errors
+
+
+def compare(current, baseline, tolerance, min_delta_ms=0.05):
+    """
+    Prints p50/p95 changes per stage and returns the stages that got slower than
+    tolerance. Changes below min_delta_ms are treated as timer noise.
+    """
+    regressions = []
+    for stage, now in current['stages'].items():
+        before = baseline['stages'].get(stage)
+        if not before:
+            continue
+        if before.get('includes_classifier', True) != now.get('includes_classifier', True):
+            print(f'{stage:<32} not compared: the classifier was only loaded in one run')
+            continue
+        for metric in ('p50_ms', 'p95_ms'):
+            if not before[metric]:
+                continue
+            change = (now[metric] - before[metric]) / before[metric]
+            flag = ''
+            if change > tolerance and now[metric] - before[metric] > min_delta_ms:
+                flag = '  REGRESSION'
+                regressions.append(f'{stage} {metric}')
+            print(f'{stage:<32} {metric:<7} {before[metric]:>10.3f} -> {now[metric]:>10.3f} ({change:+.1%}){flag}')
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Skill-Sync analysis pipeline.")
+    parser.add_argument('--data', default='data/UpdatedResumeDataSet.csv')
+    parser.add_argument('--sample', type=int, default=200, help="Resumes to sample from the dataset")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--compare', help="Baseline JSON from an earlier run")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="Allowed slowdown before flagging (0.10 = 10%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    report = {
+        'environment': environment(),
+        'config': {'sample': args.sample, 'repeat': args.repeat, 'seed': args.seed},
+        'stages': run(args.data, args.sample, args.repeat, args.seed),
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'stage':<32} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>10} {'peak KB':>9}")
+    for stage, r in report['stages'].items():
+        print(f"{stage:<32} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['p99_ms']:>9.3f} "
+              f"{r['throughput_per_sec']:>10} {r['peak_memory_kb']:>9}")
+    if report['environment']['model_errors']['classifier']:
+        print(f"predict_category skipped and pipeline_text timed without it: "
+              f"{report['environment']['model_errors']['classifier']}")
+    print(f"Saved {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
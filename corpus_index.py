@@ -0,0 +1,163 @@
+"""
+Persistent TF-IDF index over the resume corpus.
+
+IDF is fitted once on the corpus (or taken from tfidf_vectorizer.pkl), resume
+vectors are stored L2-normalised in a CSR matrix, and "top-K resumes for this
+JD" is a single sparse matrix-vector product.
+
+    python corpus_index.py build data/UpdatedResumeDataSet.csv resume_index
+    python corpus_index.py query resume_index jd.txt --top-k 10
+"""
+import argparse
+import json
+import os
+import pickle
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+
+class ResumeIndex:
+    """
+    L2-normalised TF-IDF rows for a set of resumes, queried by cosine similarity.
+    """
+
+    def __init__(self, vectorizer, matrix=None, ids=None):
+        self.vectorizer = vectorizer
+        n_features = len(vectorizer.vocabulary_)
+        self._matrix = matrix if matrix is not None else sparse.csr_matrix((0, n_features))
+        self.ids = list(ids or [])
+        self._pending = []
+
+    @classmethod
+    def build(cls, texts, ids=None, vectorizer=None, max_features=None):
+        """
+        Builds an index from cleaned texts. Without a vectorizer, IDF is fitted on the texts.
+        """
+        texts = list(texts)
+        if vectorizer is None:
+            vectorizer = TfidfVectorizer(max_features=max_features, sublinear_tf=True)
+            vectorizer.fit(texts)
+        index = cls(vectorizer)
+        index.add(texts, ids if ids is not None else range(len(texts)))
+        return index
+
+    def vectorize(self, texts):
+        # The vectorizer normally normalises already; this covers norm=None vectorizers
+        return normalize(self.vectorizer.transform(texts), norm='l2', copy=False).tocsr()
+
+    def add(self, texts, ids):
+        """
+        Appends resumes using the existing IDF weights, without refitting.
+        """
+        texts = list(texts)
+        ids = [str(i) for i in ids]
+        if len(texts) != len(ids):
+            raise ValueError("texts and ids must have the same length")
+        if texts:
+            self._pending.append(self.vectorize(texts))
+            self.ids.extend(ids)
+
+    @property
+    def matrix(self):
+        if self._pending:
+            self._matrix = sparse.vstack([self._matrix] + self._pending, format='csr')
+            self._pending = []
+        return self._matrix
+
+    def __len__(self):
+        return len(self.ids)
+
+    def scores(self, clean_jd):
+        query = self.vectorize([clean_jd])
+        return np.asarray((self.matrix @ query.T).todense()).ravel()
+
+    def top_k(self, clean_jd, k=10):
+        """
+        Returns [(resume_id, similarity)] for the k resumes closest to the JD, best first.
+        """
+        scores = self.scores(clean_jd)
+        if len(scores) == 0:
+            return []
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.ids[i], float(scores[i])) for i in best]
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        sparse.save_npz(os.path.join(directory, 'matrix.npz'), self.matrix)
+        with open(os.path.join(directory, 'ids.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.ids, f)
+        with open(os.path.join(directory, 'vectorizer.pkl'), 'wb') as f:
+            pickle.dump(self.vectorizer, f)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, 'vectorizer.pkl'), 'rb') as f:
+            vectorizer = pickle.load(f)
+        with open(os.path.join(directory, 'ids.json'), encoding='utf-8') as f:
+            ids = json.load(f)
+        matrix = sparse.load_npz(os.path.join(directory, 'matrix.npz')).tocsr()
+        return cls(vectorizer, matrix, ids)
+
+
+def main(argv=None):
+    from batch import iter_resumes
+    from models import get_model
+    from utils import clean_text
+
+    parser = argparse.ArgumentParser(description="Build or query the resume TF-IDF index.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Index a resume CSV or PDF directory")
+    build.add_argument('source')
+    build.add_argument('index_dir')
+    build.add_argument('--refit', action='store_true', help="Fit IDF on the corpus instead of reusing the shipped vectorizer")
+    build.add_argument('--max-features', type=int, default=None)
+
+    add = commands.add_parser('add', help="Append resumes to an existing index without refitting")
+    add.add_argument('index_dir')
+    add.add_argument('source')
+
+    query = commands.add_parser('query', help="Top-K resumes for a job description")
+    query.add_argument('index_dir')
+    query.add_argument('jd', help="Path to a text file with the job description")
+    query.add_argument('--top-k', type=int, default=10)
+
+    args = parser.parse_args(argv)
+
+    if args.command in ('build', 'add'):
+        from utils import PDFExtractionError, extract_resume_text
+        ids, texts = [], []
+        for resume_id, payload in iter_resumes(args.source):
+            if payload.lower().endswith('.pdf') and os.path.isfile(payload):
+                try:
+                    texts.append(extract_resume_text(payload)[1])
+                except PDFExtractionError as e:
+                    print(f"Skipping {resume_id}: {e}")
+                    continue
+            else:
+                texts.append(clean_text(payload))
+            ids.append(resume_id)
+        if args.command == 'build':
+            vectorizer = None if args.refit else get_model('vectorizer')
+            index = ResumeIndex.build(texts, ids, vectorizer=vectorizer, max_features=args.max_features)
+        else:
+            index = ResumeIndex.load(args.index_dir)
+            index.add(texts, ids)
+        index.save(args.index_dir)
+        print(f"Indexed {len(index)} resumes into {args.index_dir}")
+        return
+
+    index = ResumeIndex.load(args.index_dir)
+    with open(args.jd, encoding='utf-8') as f:
+        clean_jd = clean_text(f.read())
+    for rank, (resume_id, similarity) in enumerate(index.top_k(clean_jd, args.top_k), 1):
+        print(f"{rank:>3}. {resume_id:<30} {round(similarity * 100, 2):>6}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Approximate "similar resumes / similar jobs" search over LSA embeddings.
+
+TF-IDF vectors from a ResumeIndex are reduced with TruncatedSVD, L2-normalised
+and grouped into k-means clusters (an IVF index). A query only scans the
+`nprobe` clusters whose centroids are closest, so raising nprobe trades latency
+for recall. Embeddings are stored cluster by cluster in a .npy file that is
+memory-mapped on load.
+
+    python corpus_index.py build data/UpdatedResumeDataSet.csv resume_index
+    python embedding_index.py build resume_index resume_ann
+    python embedding_index.py query resume_ann --jd jd.txt --top-k 10 --nprobe 8
+    python embedding_index.py query resume_ann --resume-id 42
+"""
+import argparse
+import json
+import os
+
+import joblib
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.preprocessing import normalize
+
+DEFAULT_COMPONENTS = 128
+DEFAULT_NPROBE = 8
+
+
+class EmbeddingIndex:
+    """
+    IVF index over L2-normalised LSA embeddings; scores are cosine similarities.
+    """
+
+    def __init__(self, vectorizer, svd, centroids, offsets, embeddings, ids, nprobe=DEFAULT_NPROBE):
+        self.vectorizer = vectorizer
+        self.svd = svd
+        self.centroids = centroids
+        # Rows offsets[i]:offsets[i + 1] of `embeddings` belong to cluster i
+        self.offsets = offsets
+        self.embeddings = embeddings
+        self.ids = ids
+        self.nprobe = nprobe
+        self._positions = None
+
+    @classmethod
+    def build(cls, tfidf_matrix, ids, vectorizer, n_components=DEFAULT_COMPONENTS, n_lists=None, seed=0):
+        n_rows, n_features = tfidf_matrix.shape
+        n_components = max(1, min(n_components, n_features - 1, n_rows - 1))
+        svd = TruncatedSVD(n_components=n_components, random_state=seed)
+        embeddings = normalize(svd.fit_transform(tfidf_matrix)).astype(np.float32)
+
+        # ~sqrt(n) clusters keeps both the centroid scan and each list scan small
+        n_lists = n_lists or max(1, int(np.sqrt(n_rows)))
+        n_lists = min(n_lists, n_rows)
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=seed, n_init=3,
+                                 batch_size=max(1024, n_lists * 4))
+        labels = kmeans.fit_predict(embeddings)
+        centroids = normalize(kmeans.cluster_centers_).astype(np.float32)
+
+        order = np.argsort(labels, kind='stable')
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_lists), out=offsets[1:])
+        ids = [str(ids[i]) for i in order]
+        return cls(vectorizer, svd, centroids, offsets, np.ascontiguousarray(embeddings[order]), ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def embed(self, clean_texts):
+        return normalize(self.svd.transform(self.vectorizer.transform(clean_texts))).astype(np.float32)
+
+    def search(self, query, k=10, nprobe=None, exclude=None):
+        """
+        Returns [(id, similarity)] for the k nearest embeddings to a query vector.
+        """
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        rows = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in lists])
+        if len(rows) == 0:
+            return []
+        scores = self.embeddings[rows] @ query
+        if exclude is not None:
+            scores[rows == exclude] = -np.inf
+        k = min(k, len(rows))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.ids[rows[i]], float(scores[i])) for i in best if np.isfinite(scores[i])]
+
+    def similar_to_text(self, clean_text, k=10, nprobe=None):
+        return self.search(self.embed([clean_text])[0], k, nprobe)
+
+    def similar_to_id(self, resume_id, k=10, nprobe=None):
+        if self._positions is None:
+            self._positions = {resume_id: row for row, resume_id in enumerate(self.ids)}
+        row = self._positions[str(resume_id)]
+        return self.search(np.asarray(self.embeddings[row]), k, nprobe, exclude=row)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'embeddings.npy'), self.embeddings)
+        np.save(os.path.join(directory, 'centroids.npy'), self.centroids)
+        np.save(os.path.join(directory, 'offsets.npy'), self.offsets)
+        with open(os.path.join(directory, 'ids.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.ids, f)
+        joblib.dump({'vectorizer': self.vectorizer, 'svd': self.svd, 'nprobe': self.nprobe},
+                    os.path.join(directory, 'model.joblib'))
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        model = joblib.load(os.path.join(directory, 'model.joblib'))
+        embeddings = np.load(os.path.join(directory, 'embeddings.npy'), mmap_mode='r' if mmap else None)
+        centroids = np.load(os.path.join(directory, 'centroids.npy'))
+        offsets = np.load(os.path.join(directory, 'offsets.npy'))
+        with open(os.path.join(directory, 'ids.json'), encoding='utf-8') as f:
+            ids = json.load(f)
+        return cls(model['vectorizer'], model['svd'], centroids, offsets, embeddings, ids, model['nprobe'])
+
+
+def main(argv=None):
+    from corpus_index import ResumeIndex
+    from utils import clean_text
+
+    parser = argparse.ArgumentParser(description="Build or query the approximate similar-resume index.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Embed a TF-IDF ResumeIndex and cluster it")
+    build.add_argument('resume_index', help="Directory written by 'corpus_index.py build'")
+    build.add_argument('out_dir')
+    build.add_argument('--components', type=int, default=DEFAULT_COMPONENTS)
+    build.add_argument('--lists', type=int, default=None, help="Number of IVF clusters (default: sqrt(n))")
+    build.add_argument('--nprobe', type=int, default=DEFAULT_NPROBE, help="Default clusters scanned per query")
+    build.add_argument('--seed', type=int, default=0)
+
+    query = commands.add_parser('query', help="Nearest resumes to a JD or to an indexed resume")
+    query.add_argument('index_dir')
+    target = query.add_mutually_exclusive_group(required=True)
+    target.add_argument('--jd', help="Path to a text file with a job description or resume text")
+    target.add_argument('--resume-id')
+    query.add_argument('--top-k', type=int, default=10)
+    query.add_argument('--nprobe', type=int, default=None, help="Clusters to scan: higher is slower but more accurate")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        source = ResumeIndex.load(args.resume_index)
+        index = EmbeddingIndex.build(source.matrix, source.ids, source.vectorizer,
+                                     args.components, args.lists, args.seed)
+        index.nprobe = args.nprobe
+        index.save(args.out_dir)
+        print(f"Embedded {len(index)} resumes into {len(index.centroids)} clusters at {args.out_dir}")
+        return
+
+    index = EmbeddingIndex.load(args.index_dir)
+    if args.jd:
+        with open(args.jd, encoding='utf-8') as f:
+            results = index.similar_to_text(clean_text(f.read()), args.top_k, args.nprobe)
+    else:
+        results = index.similar_to_id(args.resume_id, args.top_k, args.nprobe)
+    for rank, (resume_id, similarity) in enumerate(results, 1):
+        print(f"{rank:>3}. {resume_id:<30} {round(similarity * 100, 2):>6}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+"""
+Incremental ingestion of resume CSVs into a compact, memory-mappable column store.
+
+Each row is repaired (mojibake such as "NaÃ¯ve" -> "Naïve"), cleaned with
+clean_text, and stored with its skills and predicted category. Rows are
+deduplicated by the SHA-256 of the repaired text, and a source that was ingested
+before is resumed after the last row read, so re-runs only process new rows.
+
+    python ingest.py data/UpdatedResumeDataSet.csv resume_store
+
+Store layout (all append-only, read back with numpy.memmap):
+    raw.bin / raw_offsets.bin        repaired resume text, utf-8, int64 offsets
+    clean.bin / clean_offsets.bin    clean_text output, utf-8, int64 offsets
+    skills.bin / skill_offsets.bin   int32 skill ids per row (CSR layout)
+    category.bin / label.bin         int32 codes into meta.json vocabularies
+    digests.bin                      32-byte SHA-256 per row
+    meta.json                        row count, vocabularies, per-source progress
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+from utils import clean_text, extract_skills, predict_categories
+
+_NON_ASCII_RUN = re.compile(r'[^\x00-\x7f]+')
+
+_COLUMNS = {
+    # Fixed-width columns: name -> (dtype, items per row)
+    'raw_offsets': (np.int64, 1),
+    'clean_offsets': (np.int64, 1),
+    'skill_offsets': (np.int64, 1),
+    'category': (np.int32, 1),
+    'label': (np.int32, 1),
+    'digests': (np.uint8, 32),
+}
+
+
+def _repair_run(match):
+    run = match.group()
+    for encoding in ('latin-1', 'cp1252'):
+        try:
+            return run.encode(encoding).decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            continue
+    return run
+
+
+def repair_mojibake(text):
+    """
+    Undoes UTF-8 text that was decoded as Latin-1/cp1252, one non-ASCII run at a time.
+    """
+    return _NON_ASCII_RUN.sub(_repair_run, text)
+
+
+class ColumnStore:
+    """
+    Append-only resume store. Only rows counted in meta.json are visible, so a
+    crash mid-append leaves the previous state readable.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                self.meta = json.load(f)
+        else:
+            self.meta = {'rows': 0, 'skills': [], 'categories': [], 'labels': [], 'sources': {}}
+        self._digests = None
+        self._views = {}
+        self._vocab_index = {}
+
+    def __len__(self):
+        return self.meta['rows']
+
+    def _file(self, name):
+        return os.path.join(self.path, name + '.bin')
+
+    def _column(self, name, dtype, width, length):
+        """
+        Memory-maps the first `length` rows of a column.
+        """
+        if length == 0 or not os.path.exists(self._file(name)):
+            return np.zeros((0, width) if width > 1 else 0, dtype=dtype)
+        shape = (length, width) if width > 1 else (length,)
+        return np.memmap(self._file(name), dtype=dtype, mode='r', shape=shape)
+
+    def _offsets(self, name):
+        # Offset columns hold one leading zero plus one end offset per row
+        key = (name, len(self))
+        if key not in self._views:
+            self._views[key] = self._column(name, np.int64, 1, len(self) + 1 if len(self) else 0)
+        return self._views[key]
+
+    def _blob(self, name, offsets):
+        key = (name, len(self))
+        if key not in self._views:
+            size = int(offsets[-1]) if len(offsets) else 0
+            self._views[key] = self._column(name, np.uint8, 1, size)
+        return self._views[key]
+
+    def _text(self, column, i):
+        offsets = self._offsets(column + '_offsets')
+        data = self._blob(column, offsets)
+        return bytes(data[offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+    def raw_text(self, i):
+        return self._text('raw', i)
+
+    def clean_text(self, i):
+        return self._text('clean', i)
+
+    def skill_ids(self, i):
+        offsets = self._offsets('skill_offsets')
+        key = ('skills', len(self))
+        if key not in self._views:
+            self._views[key] = self._column('skills', np.int32, 1, int(offsets[-1]) if len(offsets) else 0)
+        return self._views[key][offsets[i]:offsets[i + 1]]
+
+    def skills(self, i):
+        vocab = self.meta['skills']
+        return [vocab[j] for j in self.skill_ids(i)]
+
+    def category_codes(self):
+        return self._column('category', np.int32, 1, len(self))
+
+    def category(self, i):
+        return self.meta['categories'][self.category_codes()[i]]
+
+    def label(self, i):
+        code = self._column('label', np.int32, 1, len(self))[i]
+        return self.meta['labels'][code] if code >= 0 else None
+
+    def iter_rows(self):
+        for i in range(len(self)):
+            yield {
+                'raw_text': self.raw_text(i),
+                'clean_text': self.clean_text(i),
+                'skills': self.skills(i),
+                'category': self.category(i),
+                'label': self.label(i),
+            }
+
+    def digests(self):
+        if self._digests is None:
+            column = self._column('digests', np.uint8, 32, len(self))
+            self._digests = {bytes(row) for row in column}
+        return self._digests
+
+    def _code(self, vocab_name, value):
+        vocab = self.meta[vocab_name]
+        index = self._vocab_index.get(vocab_name)
+        if index is None:
+            index = self._vocab_index[vocab_name] = {v: i for i, v in enumerate(vocab)}
+        if value not in index:
+            index[value] = len(vocab)
+            vocab.append(value)
+        return index[value]
+
+    def _truncate_to_committed(self):
+        """
+        Drops bytes written by an append that never reached meta.json.
+        """
+        rows = len(self)
+        sizes = {name: (rows + (1 if 'offsets' in name and rows else 0)) * np.dtype(dtype).itemsize * width
+                 for name, (dtype, width) in _COLUMNS.items()}
+        for blob, offsets_name, itemsize in (('raw', 'raw_offsets', 1), ('clean', 'clean_offsets', 1),
+                                             ('skills', 'skill_offsets', 4)):
+            offsets = self._offsets(offsets_name)
+            sizes[blob] = (int(offsets[-1]) if len(offsets) else 0) * itemsize
+        self._views.clear()
+        for name, size in sizes.items():
+            if os.path.exists(self._file(name)) and os.path.getsize(self._file(name)) > size:
+                with open(self._file(name), 'r+b') as f:
+                    f.truncate(size)
+
+    def append(self, rows):
+        """
+        Appends dicts with raw_text, clean_text, skills, category, label (may be
+        None) and a 32-byte digest. Nothing is visible to readers until commit().
+        """
+        if not rows:
+            return 0
+        self._truncate_to_committed()
+        seen = self.digests()
+        ends = {'raw': self._last_offset('raw_offsets'), 'clean': self._last_offset('clean_offsets'),
+                'skills': self._last_offset('skill_offsets')}
+        first = len(self) == 0
+        handles = {name: open(self._file(name), 'ab') for name in
+                   ('raw', 'clean', 'skills', 'raw_offsets', 'clean_offsets', 'skill_offsets',
+                    'category', 'label', 'digests')}
+        try:
+            if first:
+                zero = np.zeros(1, dtype=np.int64).tobytes()
+                for name in ('raw_offsets', 'clean_offsets', 'skill_offsets'):
+                    handles[name].write(zero)
+            for row in rows:
+                raw = row['raw_text'].encode('utf-8')
+                clean = row['clean_text'].encode('utf-8')
+                skill_ids = np.array([self._code('skills', s) for s in row['skills']], dtype=np.int32)
+                handles['raw'].write(raw)
+                handles['clean'].write(clean)
+                handles['skills'].write(skill_ids.tobytes())
+                ends['raw'] += len(raw)
+                ends['clean'] += len(clean)
+                ends['skills'] += len(skill_ids)
+                handles['raw_offsets'].write(np.int64(ends['raw']).tobytes())
+                handles['clean_offsets'].write(np.int64(ends['clean']).tobytes())
+                handles['skill_offsets'].write(np.int64(ends['skills']).tobytes())
+                handles['category'].write(np.int32(self._code('categories', row['category'])).tobytes())
+                label = -1 if row.get('label') is None else self._code('labels', row['label'])
+                handles['label'].write(np.int32(label).tobytes())
+                handles['digests'].write(row['digest'])
+                seen.add(row['digest'])
+        finally:
+            for handle in handles.values():
+                handle.close()
+        self.meta['rows'] += len(rows)
+        self._views.clear()
+        return len(rows)
+
+    def _last_offset(self, name):
+        offsets = self._offsets(name)
+        return int(offsets[-1]) if len(offsets) else 0
+
+    def commit(self):
+        tmp = os.path.join(self.path, 'meta.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f)
+        os.replace(tmp, os.path.join(self.path, 'meta.json'))
+
+
+def ingest_csv(csv_path, store, text_column='Resume', label_column='Category', batch_size=256):
+    """
+    Adds rows from csv_path that the store has not seen. Returns (new, duplicates).
+    """
+    source = os.path.abspath(csv_path)
+    progress = store.meta['sources'].get(source, {})
+    skip = progress.get('rows_read', 0)
+    # A shrunken file was rewritten rather than appended to; dedup still protects the store
+    if os.path.getsize(csv_path) < progress.get('bytes', 0):
+        skip = 0
+
+    csv.field_size_limit(sys.maxsize)
+    added = duplicates = rows_read = 0
+    batch = []
+    seen = store.digests()
+
+    def flush():
+        nonlocal added
+        if not batch:
+            return
+        categories, _ = predict_categories([row['clean_text'] for row in batch], cleaned=True)
+        for row, category in zip(batch, categories):
+            row['category'] = category
+        added += store.append(batch)
+        batch.clear()
+
+    with open(csv_path, newline='', encoding='utf-8', errors='replace') as f:
+        for row_number, row in enumerate(csv.DictReader(f)):
+            rows_read = row_number + 1
+            if row_number < skip:
+                continue
+            raw = repair_mojibake(row[text_column])
+            digest = hashlib.sha256(raw.encode('utf-8')).digest()
+            if digest in seen or any(r['digest'] == digest for r in batch):
+                duplicates += 1
+                continue
+            clean = clean_text(raw)
+            label = repair_mojibake(row[label_column]) if label_column in row else None
+            batch.append({'raw_text': raw, 'clean_text': clean, 'skills': extract_skills(clean),
+                          'label': label, 'digest': digest})
+            if len(batch) >= batch_size:
+                flush()
+    flush()
+
+    store.meta['sources'][source] = {'rows_read': max(rows_read, skip), 'bytes': os.path.getsize(csv_path)}
+    store.commit()
+    return added, duplicates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest resume CSVs into a memory-mappable column store.")
+    parser.add_argument('csv', nargs='+')
+    parser.add_argument('store')
+    parser.add_argument('--text-column', default='Resume')
+    parser.add_argument('--label-column', default='Category')
+    args = parser.parse_args(argv)
+
+    store = ColumnStore(args.store)
+    for csv_path in args.csv:
+        added, duplicates = ingest_csv(csv_path, store, args.text_column, args.label_column)
+        print(f"{csv_path}: {added} new rows, {duplicates} duplicates skipped")
+    print(f"{args.store}: {len(store)} rows")
+
+
+if __name__ == '__main__':
+    main()
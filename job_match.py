@@ -0,0 +1,85 @@
+"""
+Rank many job descriptions against one resume.
+
+    python job_match.py resume.pdf jobs/ --top-k 20
+    python job_match.py resume.txt jobs.csv --text-column description
+
+`jobs` is a directory of .txt/.md files (one JD each) or a CSV with one JD per row.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from utils import extract_resume_text, clean_text, analyze_matches
+
+JD_EXTENSIONS = ('.txt', '.md')
+
+
+def iter_job_descriptions(source, text_column='description', id_column=None):
+    """
+    Yields (jd_id, text) pairs from a directory of text files or a CSV.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.lower().endswith(JD_EXTENSIONS):
+                with open(os.path.join(source, name), encoding='utf-8', errors='replace') as f:
+                    yield name, f.read()
+    else:
+        csv.field_size_limit(sys.maxsize)
+        with open(source, newline='', encoding='utf-8', errors='replace') as f:
+            for row_number, row in enumerate(csv.DictReader(f)):
+                yield (row[id_column] if id_column else str(row_number)), row[text_column]
+
+
+def rank_jobs(resume_text, jobs, clean_resume=None, top_k=None, must_have=None):
+    """
+    Scores one resume against every (jd_id, text) in `jobs` and returns the
+    results best first, ranked like batch.rank_resumes. JDs naming no known
+    skill get the full keyword score for free, so they rank after every JD
+    that does.
+    """
+    if clean_resume is None:
+        clean_resume = clean_text(resume_text)
+    jobs = list(jobs)
+    analyses = analyze_matches(resume_text, clean_resume, [clean_text(text) for _, text in jobs],
+                               must_have=must_have)
+    results = [dict(analysis, id=jd_id) for (jd_id, _), analysis in zip(jobs, analyses)]
+    results.sort(key=lambda r: (bool(r['matching_skills'] or r['missing_skills']), r['ats_score'],
+                                r['match_percentage']), reverse=True)
+    return results[:top_k] if top_k else results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank job descriptions against one resume.")
+    parser.add_argument('resume', help="PDF resume or a text file with the resume text")
+    parser.add_argument('jobs', help="Directory of .txt/.md job descriptions or a CSV with one per row")
+    parser.add_argument('--text-column', default='description', help="CSV column holding the JD text")
+    parser.add_argument('--id-column', default=None, help="CSV column to report as the JD id (default: row number)")
+    parser.add_argument('--top-k', type=int, default=None)
+    parser.add_argument('--json', action='store_true', help="Print full results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.resume.lower().endswith('.pdf'):
+        resume_text, clean_resume, truncated = extract_resume_text(args.resume)
+        if truncated:
+            print(f"Warning: resume text was cut short by the PDF {truncated} limit", file=sys.stderr)
+    else:
+        with open(args.resume, encoding='utf-8') as f:
+            resume_text = f.read()
+        clean_resume = clean_text(resume_text)
+
+    jobs = iter_job_descriptions(args.jobs, args.text_column, args.id_column)
+    results = rank_jobs(resume_text, jobs, clean_resume, args.top_k)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:>3}. {result['id']:<30} ATS {result['ats_score']:>3}  "
+              f"Match {result['match_percentage']:>6}%  Missing: {', '.join(result['missing_skills']) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
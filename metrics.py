@@ -0,0 +1,284 @@
+"""
+Optional instrumentation: stage timers, counters and size observations.
+
+Nothing is recorded until a sink is installed, and every helper returns after a
+single check when it is not, so the instrumented hot paths stay near zero-cost.
+
+    SKILLSYNC_METRICS=log        one log line per event (logger "skillsync.metrics")
+    SKILLSYNC_METRICS=registry   in-process registry, rendered by prometheus_text()
+
+or call set_sink() with any object that has timing/incr/observe methods.
+"""
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds, in milliseconds, of the latency histogram buckets
+TIMING_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_sink = None
+
+
+def set_sink(sink):
+    global _sink
+    _sink = sink
+
+
+def get_sink():
+    return _sink
+
+
+def enabled():
+    return _sink is not None
+
+
+def incr(name, value=1, **labels):
+    if _sink is not None:
+        _sink.incr(name, value, labels)
+
+
+def observe(name, value, **labels):
+    if _sink is not None:
+        _sink.observe(name, value, labels)
+
+
+def timing(name, ms, **labels):
+    if _sink is not None:
+        _sink.timing(name, ms, labels)
+
+
+@contextmanager
+def _timer(stage, labels):
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        _sink.incr('errors_total', 1, dict(labels, stage=stage))
+        raise
+    finally:
+        _sink.timing('stage_duration_ms', (time.perf_counter() - start) * 1000, dict(labels, stage=stage))
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stage, **labels):
+    """
+    Context manager that records how long the block took under `stage`.
+    """
+    if _sink is None:
+        return _NULL_TIMER
+    return _timer(stage, labels)
+
+
+def timed(stage):
+    """
+    Decorator form of timer() for whole functions.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _sink is None:
+                return fn(*args, **kwargs)
+            with _timer(stage, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+class LogSink:
+    """
+    Writes every event as a log line, for ad-hoc investigation.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger('skillsync.metrics')
+        self.level = level
+
+    def _log(self, kind, name, value, labels):
+        label_text = ' '.join(f'{k}={v}' for k, v in sorted(labels.items()))
+        self.logger.log(self.level, "%s %s=%s %s", kind, name, value, label_text)
+
+    def timing(self, name, ms, labels):
+        self._log('timing', name, round(ms, 3), labels)
+
+    def incr(self, name, value, labels):
+        self._log('count', name, value, labels)
+
+    def observe(self, name, value, labels):
+        self._log('observe', name, value, labels)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe in-process counters, summaries and latency histograms.
+    """
+
+    def __init__(self, buckets=TIMING_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counters = {}
+        self.summaries = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name, value, labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            count, total, largest = self.summaries.get(key, (0, 0.0, value))
+            self.summaries[key] = (count + 1, total + value, max(largest, value))
+
+    def timing(self, name, ms, labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            buckets, _, _ = histogram
+            for i, bound in enumerate(self.buckets):
+                if ms <= bound:
+                    buckets[i] += 1
+                    break
+            else:
+                buckets[-1] += 1
+            histogram[1] += 1
+            histogram[2] += ms
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': {_flat_name(k): v for k, v in self.counters.items()},
+                'summaries': {_flat_name(k): {'count': c, 'sum': s, 'max': m}
+                              for k, (c, s, m) in self.summaries.items()},
+                'timings': {_flat_name(k): {'count': h[1], 'sum_ms': h[2]} for k, h in self.histograms.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.summaries.clear()
+            self.histograms.clear()
+
+    def drain(self):
+        """
+        Returns the raw (counters, summaries, histograms) and starts empty, so a
+        worker process can ship what it recorded to the parent's registry.
+        """
+        with self._lock:
+            state = (self.counters, self.summaries, self.histograms)
+            self.counters, self.summaries, self.histograms = {}, {}, {}
+        return state
+
+    def merge(self, state, **labels):
+        """
+        Adds a drain() result from another registry, tagging every series with `labels`.
+        """
+        counters, summaries, histograms = state
+
+        def relabel(key):
+            name, old = key
+            return name, _label_key(dict(old, **labels))
+
+        with self._lock:
+            for key, value in counters.items():
+                key = relabel(key)
+                self.counters[key] = self.counters.get(key, 0) + value
+            for key, (count, total, largest) in summaries.items():
+                key = relabel(key)
+                if key in self.summaries:
+                    c, t, m = self.summaries[key]
+                    count, total, largest = c + count, t + total, max(m, largest)
+                self.summaries[key] = (count, total, largest)
+            for key, (buckets, count, total) in histograms.items():
+                key = relabel(key)
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+                histogram[0] = [a + b for a, b in zip(histogram[0], buckets)]
+                histogram[1] += count
+                histogram[2] += total
+
+
+def _flat_name(key):
+    name, labels = key
+    if not labels:
+        return name
+    return name + '{' + ','.join(f'{k}={v}' for k, v in labels) + '}'
+
+
+def _prom_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+
+def prometheus_text(registry, prefix='skillsync_'):
+    """
+    Renders a MetricsRegistry in the Prometheus text exposition format.
+    """
+    lines = []
+    with registry._lock:
+        counters = sorted(registry.counters.items())
+        summaries = sorted(registry.summaries.items())
+        histograms = sorted((k, (list(b), c, s)) for k, (b, c, s) in registry.histograms.items())
+
+    seen = set()
+    for (name, labels), value in counters:
+        metric = prefix + name
+        if metric not in seen:
+            lines.append(f'# TYPE {metric} counter')
+            seen.add(metric)
+        lines.append(f'{metric}{_prom_labels(labels)} {value}')
+
+    for (name, labels), (count, total, _) in summaries:
+        metric = prefix + name
+        if metric not in seen:
+            lines.append(f'# TYPE {metric} summary')
+            seen.add(metric)
+        lines.append(f'{metric}_count{_prom_labels(labels)} {count}')
+        lines.append(f'{metric}_sum{_prom_labels(labels)} {total}')
+
+    for (name, labels), (buckets, count, total) in histograms:
+        metric = prefix + name
+        if metric not in seen:
+            lines.append(f'# TYPE {metric} histogram')
+            seen.add(metric)
+        cumulative = 0
+        for bound, hits in zip(registry.buckets + ('+Inf',), buckets):
+            cumulative += hits
+            lines.append(f'{metric}_bucket{_prom_labels(labels, [("le", bound)])} {cumulative}')
+        lines.append(f'{metric}_count{_prom_labels(labels)} {count}')
+        lines.append(f'{metric}_sum{_prom_labels(labels)} {total}')
+    return '\n'.join(lines) + '\n'
+
+
+def configure_from_env():
+    mode = os.environ.get('SKILLSYNC_METRICS', '').strip().lower()
+    if mode == 'log':
+        set_sink(LogSink())
+    elif mode in ('registry', 'prometheus'):
+        set_sink(MetricsRegistry())
+
+
+configure_from_env()
@@ -0,0 +1,126 @@
+"""
+Lazy registry for the pickled model artifacts.
+
+Each artifact is loaded on first use and kept for the life of the process.
+A .joblib copy is preferred when present because its numpy arrays can be
+memory-mapped, letting worker processes share the pages instead of each
+holding a private copy.
+
+    python models.py export    # write .joblib copies next to the .pkl files
+"""
+import logging
+import os
+import pickle
+import threading
+import time
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.environ.get('SKILLSYNC_MODEL_DIR', os.path.dirname(os.path.abspath(__file__)))
+
+# Candidate files per artifact, tried in order
+ARTIFACTS = {
+    'classifier': ['category_classifier.joblib', 'rf_classifier.joblib', 'rf_classifier.pkl'],
+    'vectorizer': ['tfidf_vectorizer.joblib', 'tfidf_vectorizer.pkl'],
+}
+
+_MISSING = object()
+_loaded = {}
+_errors = {}
+# Artifact name -> file it was loaded from
+_sources = {}
+_lock = threading.Lock()
+
+
+def _load_file(path):
+    if path.endswith('.joblib'):
+        return joblib.load(path, mmap_mode='r')
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _load(name):
+    candidates = ARTIFACTS[name]
+    for filename in candidates:
+        path = os.path.join(MODEL_DIR, filename)
+        if not os.path.exists(path):
+            continue
+        start = time.perf_counter()
+        try:
+            model = _load_file(path)
+        except Exception as e:
+            _errors[name] = f"{filename}: {e!r}"
+            logger.warning("Failed to load %s from %s: %r", name, path, e)
+            continue
+        logger.info("Loaded %s from %s in %.1f ms", name, path, (time.perf_counter() - start) * 1000)
+        _errors.pop(name, None)
+        _sources[name] = filename
+        return model
+    if name not in _errors:
+        _errors[name] = f"none of {', '.join(candidates)} found in {MODEL_DIR}"
+    logger.warning("Model %s unavailable: %s", name, _errors[name])
+    return None
+
+
+def get_model(name):
+    """
+    Returns the named artifact, or None if it could not be loaded.
+    The outcome, including a failure, is remembered until reset() is called.
+    """
+    model = _loaded.get(name, _MISSING)
+    if model is _MISSING:
+        with _lock:
+            model = _loaded.get(name, _MISSING)
+            if model is _MISSING:
+                model = _loaded[name] = _load(name)
+    return model
+
+
+def load_error(name):
+    return _errors.get(name)
+
+
+def reset(name=None):
+    with _lock:
+        if name is None:
+            _loaded.clear()
+            _errors.clear()
+            _sources.clear()
+        else:
+            _loaded.pop(name, None)
+            _errors.pop(name, None)
+            _sources.pop(name, None)
+
+
+def export_joblib(name):
+    """
+    Writes a .joblib copy of a loaded artifact next to the file it came from, under
+    the same name, so later processes can mmap it. An artifact that was already
+    loaded from a .joblib file is left alone and its path returned.
+    """
+    model = get_model(name)
+    if model is None:
+        raise FileNotFoundError(load_error(name))
+    source = _sources[name]
+    if source.endswith('.joblib'):
+        return os.path.join(MODEL_DIR, source)
+    path = os.path.join(MODEL_DIR, os.path.splitext(source)[0] + '.joblib')
+    joblib.dump(model, path)
+    return path
+
+
+if __name__ == '__main__':
+    import sys
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if sys.argv[1:] == ['export']:
+        for artifact in ARTIFACTS:
+            try:
+                print(f"{artifact}: wrote {export_joblib(artifact)}")
+            except FileNotFoundError as e:
+                print(f"{artifact}: skipped ({e})")
+    else:
+        for artifact in ARTIFACTS:
+            status = 'ok' if get_model(artifact) is not None else load_error(artifact)
+            print(f"{artifact}: {status}")
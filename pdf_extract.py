@@ -0,0 +1,112 @@
+"""
+Bounded, page-by-page PDF text extraction.
+
+Caps on file size, pages, extracted characters and wall-clock time keep one
+oversized or scanned upload from pinning a worker.
+"""
+import io
+import os
+import time
+from collections import namedtuple
+
+import PyPDF2
+
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PDF_PAGES = 20
+MAX_TEXT_CHARS = 200_000
+PDF_TIMEOUT = 10.0
+
+# truncated is None, or which cap stopped extraction early: 'pages' or 'chars'
+PDFText = namedtuple('PDFText', 'text pages truncated')
+
+
+class PDFExtractionError(ValueError):
+    """
+    Raised when a PDF cannot be turned into text. `reason` is one of
+    'too_large', 'unreadable' or 'timeout'.
+    """
+
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Keeps the reason when the error crosses a process pool boundary
+        return type(self), (self.reason, str(self))
+
+
+def _format_size(n):
+    if n >= 1024 * 1024:
+        return f"{n / (1024 * 1024):g} MB"
+    if n >= 1024:
+        return f"{n / 1024:g} KB"
+    return f"{n} bytes"
+
+
+def read_pdf_bytes(uploaded_file, max_bytes=MAX_PDF_BYTES):
+    """
+    Reads at most max_bytes + 1 bytes from a path, bytes or file-like object.
+    """
+    if isinstance(uploaded_file, (bytes, bytearray)):
+        data = bytes(uploaded_file)
+    elif isinstance(uploaded_file, (str, os.PathLike)):
+        with open(uploaded_file, 'rb') as f:
+            data = f.read(max_bytes + 1)
+    elif hasattr(uploaded_file, 'getvalue'):
+        data = uploaded_file.getvalue()
+    else:
+        data = uploaded_file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise PDFExtractionError('too_large', f"PDF is larger than the {_format_size(max_bytes)} limit")
+    return data
+
+
+def _open_pdf(uploaded_file, max_bytes):
+    data = read_pdf_bytes(uploaded_file, max_bytes)
+    try:
+        return PyPDF2.PdfReader(io.BytesIO(data))
+    except Exception as e:
+        raise PDFExtractionError('unreadable', f"Could not read PDF: {e}") from e
+
+
+def _iter_pages(pdf_reader, max_pages, timeout):
+    deadline = time.monotonic() + timeout
+    try:
+        pages = pdf_reader.pages
+        for page_number in range(min(len(pages), max_pages)):
+            if time.monotonic() > deadline:
+                raise PDFExtractionError('timeout', f"PDF extraction took longer than {timeout:g}s")
+            yield pages[page_number].extract_text() or ''
+    except PDFExtractionError:
+        raise
+    except Exception as e:
+        raise PDFExtractionError('unreadable', f"Could not read PDF: {e}") from e
+
+
+def iter_pdf_pages(uploaded_file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES, timeout=PDF_TIMEOUT):
+    """
+    Yields the text of each page, stopping after max_pages. The timeout is
+    checked between pages, so a single pathological page can still overrun it.
+    """
+    return _iter_pages(_open_pdf(uploaded_file, max_bytes), max_pages, timeout)
+
+
+def extract_pdf(uploaded_file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_PDF_BYTES,
+                max_chars=MAX_TEXT_CHARS, timeout=PDF_TIMEOUT):
+    """
+    Returns a PDFText for the document, raising PDFExtractionError on failure.
+    """
+    pdf_reader = _open_pdf(uploaded_file, max_bytes)
+    parts = []
+    total = 0
+    truncated = None
+    for page_text in _iter_pages(pdf_reader, max_pages, timeout):
+        if total + len(page_text) > max_chars:
+            parts.append(page_text[:max_chars - total])
+            truncated = 'chars'
+            break
+        parts.append(page_text)
+        total += len(page_text)
+    if truncated is None and len(parts) == max_pages and len(pdf_reader.pages) > max_pages:
+        truncated = 'pages'
+    return PDFText(''.join(parts), len(parts), truncated)
@@ -0,0 +1,126 @@
+import re
+from collections import namedtuple
+
+# Canonical section -> headings that introduce it (matched case-insensitively)
+SECTION_HEADINGS = {
+    'summary': ['summary', 'professional summary', 'career summary', 'profile', 'profile summary',
+                'professional profile', 'objective', 'career objective', 'about me'],
+    'skills': ['skills', 'skill details', 'skill set', 'skillset', 'technical skills', 'key skills', 'it skills',
+               'core competencies', 'technical proficiency', 'areas of expertise', 'competencies'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment history',
+                   'work history', 'employment', 'company details', 'experience details', 'internships',
+                   'internship'],
+    'projects': ['projects', 'project details', 'academic projects', 'personal projects', 'key projects',
+                 'project undertaken', 'projects undertaken'],
+    'education': ['education', 'education details', 'educational qualification', 'educational qualifications',
+                  'academic qualification', 'academic qualifications', 'academic details', 'qualifications'],
+    'certifications': ['certifications', 'certification', 'certificates', 'courses', 'trainings', 'training'],
+    'achievements': ['achievements', 'awards', 'accomplishments', 'honors', 'honours'],
+    'personal': ['personal details', 'personal information', 'personal profile', 'languages', 'languages known',
+                 'hobbies', 'interests', 'declaration'],
+}
+
+# Text before the first heading (name, contact lines) is reported under this name
+HEADER_SECTION = 'header'
+
+# Extracted text sometimes glues a heading to the end of the previous line
+# ("...deep learning.Education Details"); these title-case forms are distinctive
+# enough to accept anywhere as long as the line ends after them.
+_INLINE_HEADINGS = ['Education Details', 'Skill Details', 'Company Details', 'Project Details']
+
+# Headings that double as sub-labels inside other sections ("Languages: Python,
+# Java" under Skills); they only start a section when alone on their line.
+_STANDALONE_HEADINGS = {'languages', 'languages known', 'training', 'trainings', 'courses', 'employment',
+                        'profile', 'competencies', 'interests', 'hobbies'}
+
+_HEADING_NAMES = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+
+
+def _alternation(headings):
+    return '|'.join(re.escape(h) for h in sorted(headings, key=len, reverse=True))
+
+
+# A heading starts a line (after optional bullets/numbering) and is followed by
+# a colon, a dash or bullet introducing the body, or the end of the line.
+_HEADING_PATTERN = re.compile(
+    r'^[^\w\n]*(?:\d{1,2}[.)]\s*)?(?:'
+    r'(?P<heading>(?i:' + _alternation(_HEADING_NAMES.keys() - _STANDALONE_HEADINGS) + r'))(?!\w)'
+    r'[ \t]*(?:[:\-–*•|]|\r?$)'
+    r'|(?P<standalone>(?i:' + _alternation(_STANDALONE_HEADINGS) + r'))[ \t]*:?[ \t]*(?=\r?$))'
+    r'|(?P<inline>' + '|'.join(_INLINE_HEADINGS) + r')(?=[ \t]*\r?$)',
+    re.MULTILINE,
+)
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}')
+_LINK_PATTERN = re.compile(r'(?:https?://|www\.)\S+|(?<![\w.])(?:linkedin|github)\.com/\S+', re.IGNORECASE)
+
+# `start` is where the heading begins, `body_start` where its content begins;
+# `tokens` counts whitespace-separated words in the body.
+Section = namedtuple('Section', 'name heading start body_start end tokens')
+
+
+class ResumeDocument:
+    """
+    A resume split into sections, with contact fields pulled out once.
+    """
+
+    def __init__(self, text, sections, email, phone, links):
+        self.text = text
+        self.sections = sections
+        self.email = email
+        self.phone = phone
+        self.links = links
+
+    @property
+    def section_names(self):
+        """
+        Canonical names of the sections that have a heading.
+        """
+        return frozenset(s.name for s in self.sections if s.name != HEADER_SECTION)
+
+    @property
+    def token_counts(self):
+        counts = {}
+        for section in self.sections:
+            counts[section.name] = counts.get(section.name, 0) + section.tokens
+        return counts
+
+    def has_section(self, name):
+        return any(s.name == name for s in self.sections)
+
+    def section_text(self, *names):
+        """
+        Body text of every section with one of the given names, in document order.
+        """
+        return '\n'.join(self.text[s.body_start:s.end] for s in self.sections if s.name in names)
+
+
+def parse_resume(text):
+    """
+    Splits resume text into sections at detected headings in a single scan.
+    """
+    sections = []
+    name, heading, start, body_start = HEADER_SECTION, None, 0, 0
+    for match in _HEADING_PATTERN.finditer(text):
+        matched = match.group(match.lastgroup)
+        heading_start = match.start(match.lastgroup)
+        # Drop the header when the document opens with a heading
+        if name != HEADER_SECTION or text[:heading_start].strip():
+            sections.append(_section(text, name, heading, start, body_start, heading_start))
+        name, heading, start, body_start = _HEADING_NAMES[matched.lower()], matched, heading_start, match.end()
+    sections.append(_section(text, name, heading, start, body_start, len(text)))
+
+    email = EMAIL_PATTERN.search(text)
+    phone = PHONE_PATTERN.search(text)
+    return ResumeDocument(
+        text,
+        tuple(sections),
+        email=email.group() if email else None,
+        phone=phone.group() if phone else None,
+        links=tuple(m.group().rstrip('.,;)') for m in _LINK_PATTERN.finditer(text)),
+    )
+
+
+def _section(text, name, heading, start, body_start, end):
+    return Section(name, heading, start, body_start, end, len(text[body_start:end].split()))
@@ -0,0 +1,344 @@
+"""
+Async HTTP scoring service for ATS integrations.
+
+    python server.py --port 8000 --workers 4
+
+    POST /score   {"job_description": "...", "resume_pdf": "<base64>"}   (or "resume_text",
+                  optional "must_have": ["python", ...])
+    GET  /health
+    GET  /stats   per-stage latency and queue counters
+    GET  /metrics the same in Prometheus text format, plus the stage timers and
+                  counters recorded inside the workers (labelled process="worker")
+
+Built on asyncio streams from the standard library so it runs locally with no
+extra services. CPU-bound parsing and scoring run in a bounded process pool;
+when too many requests are in flight the server answers 503 with Retry-After
+instead of queueing without limit.
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+import metrics
+from pdf_extract import MAX_PDF_BYTES
+from utils import PDFExtractionError, extract_resume_text, clean_text, extract_skills, analyze_match, predict_category
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = MAX_PDF_BYTES * 4 // 3 + 1024 * 1024  # base64 PDF plus the JD
+LATENCY_WINDOW = 1000
+
+
+# Set in each pool worker by _init_worker; metrics recorded there are drained
+# into every score_request result and merged into the parent's registry
+_worker_registry = None
+
+
+def _init_worker():
+    global _worker_registry
+    _worker_registry = metrics.MetricsRegistry()
+    metrics.set_sink(_worker_registry)
+
+
+def score_request(job_description, resume_pdf=None, resume_text=None, must_have=None):
+    """
+    Runs in a worker process. Returns (result, stage timings in ms, worker metrics
+    from MetricsRegistry.drain() or None outside a pool worker).
+    """
+    if _worker_registry is not None:
+        # Drop whatever a request that raised left behind; the parent counts its errors
+        _worker_registry.drain()
+    timings = {}
+    start = time.perf_counter()
+    truncated = None
+    if resume_pdf is not None:
+        resume_text, clean_resume, truncated = extract_resume_text(resume_pdf)
+        timings['extract'] = (time.perf_counter() - start) * 1000
+    else:
+        clean_resume = clean_text(resume_text)
+
+    mark = time.perf_counter()
+    clean_jd = clean_text(job_description)
+    timings['clean'] = (time.perf_counter() - mark) * 1000
+
+    mark = time.perf_counter()
+    result = analyze_match(resume_text, clean_resume, clean_jd, must_have=must_have)
+    timings['score'] = (time.perf_counter() - mark) * 1000
+
+    mark = time.perf_counter()
+    result['predicted_category'] = predict_category(clean_resume, cleaned=True)
+    timings['classify'] = (time.perf_counter() - mark) * 1000
+    result['truncated'] = truncated
+    return result, timings, _worker_registry.drain() if _worker_registry is not None else None
+
+
+class Stats:
+    """
+    Rolling per-stage latencies plus request counters, kept in the event loop process.
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.latencies = defaultdict(lambda: deque(maxlen=window))
+        self.counters = defaultdict(int)
+
+    def record(self, stage, ms):
+        self.latencies[stage].append(ms)
+
+    def snapshot(self):
+        stages = {}
+        for stage, values in self.latencies.items():
+            ordered = sorted(values)
+            stages[stage] = {
+                'count': len(ordered),
+                'p50_ms': round(ordered[len(ordered) // 2], 2),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+                'max_ms': round(ordered[-1], 2),
+            }
+        return {'stages': stages, 'counters': dict(self.counters)}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class ScoringServer:
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 32
+        self.pending = 0
+        self.pool = None
+        self.stats = Stats()
+        # The service always keeps a registry so /metrics works; an existing one is reused
+        if not isinstance(metrics.get_sink(), metrics.MetricsRegistry):
+            metrics.set_sink(metrics.MetricsRegistry())
+        self.registry = metrics.get_sink()
+
+    def _new_pool(self):
+        # Forked workers would inherit the open client sockets, so a closed
+        # connection stays open in every worker; forkserver children start clean.
+        # Windows has no forkserver, and spawn starts clean too.
+        method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method),
+                                   initializer=_init_worker)
+
+    async def start(self, host='127.0.0.1', port=8000):
+        self.pool = self._new_pool()
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def _restart_pool(self, broken):
+        # Every request in flight on the broken pool fails; only the first replaces it
+        if self.pool is not broken:
+            return
+        self.pool = self._new_pool()
+        logger.warning("Worker pool broke; started a new one")
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as e:
+                    await write_response(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                try:
+                    status, payload = await self.dispatch(method, path, body)
+                    extra_headers = {}
+                except HTTPError as e:
+                    status, payload, extra_headers = e.status, {'error': str(e)}, e.headers
+                except Exception:
+                    # Never drop the connection without an answer
+                    logger.exception("Unhandled error serving %s %s", method, path)
+                    self.stats.counters['errors'] += 1
+                    metrics.incr('requests_total', outcome='error')
+                    status, payload, extra_headers = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "Internal server error"}, {}
+                await write_response(writer, status, payload, extra_headers, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, {'status': 'ok', 'pending': self.pending, 'workers': self.workers}
+        if path == '/stats' and method == 'GET':
+            return HTTPStatus.OK, dict(self.stats.snapshot(), pending=self.pending, max_pending=self.max_pending)
+        if path == '/metrics' and method == 'GET':
+            return HTTPStatus.OK, metrics.prometheus_text(self.registry)
+        if path == '/score':
+            if method != 'POST':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST", {'Allow': 'POST'})
+            return HTTPStatus.OK, await self.score(body)
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+
+    async def score(self, body):
+        try:
+            request = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        job_description = request.get('job_description') if isinstance(request, dict) else None
+        if not isinstance(job_description, str) or not job_description.strip():
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "job_description is required")
+        resume_pdf = request.get('resume_pdf')
+        resume_text = request.get('resume_text')
+        if resume_pdf is not None:
+            try:
+                resume_pdf = base64.b64decode(resume_pdf, validate=True)
+            except (binascii.Error, TypeError, ValueError):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "resume_pdf must be base64")
+        elif not isinstance(resume_text, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "resume_pdf or resume_text is required")
+        must_have = request.get('must_have') or []
+        if not isinstance(must_have, list) or not all(isinstance(s, str) for s in must_have):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "must_have must be a list of skill names")
+        # Resolve aliases ("k8s") to canonical skills the same way documents are matched
+        must_have = frozenset(skill for s in must_have for skill in extract_skills(clean_text(s)))
+
+        # Backpressure: refuse early rather than let the executor queue grow without bound
+        if self.pending >= self.max_pending:
+            self.stats.counters['rejected'] += 1
+            metrics.incr('requests_total', outcome='rejected')
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, retry later", {'Retry-After': '1'})
+
+        self.pending += 1
+        start = time.perf_counter()
+        pool = self.pool
+        try:
+            loop = asyncio.get_running_loop()
+            result, timings, worker_metrics = await loop.run_in_executor(
+                pool, score_request, job_description, resume_pdf, resume_text, must_have)
+        except PDFExtractionError as e:
+            self.stats.counters['pdf_errors'] += 1
+            metrics.incr('requests_total', outcome='pdf_error')
+            metrics.incr('pdf_errors_total', reason=e.reason)
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, f"{e.reason}: {e}")
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); the executor refuses all further work,
+            # so replace it and let the client retry
+            self.stats.counters['pool_restarts'] += 1
+            metrics.incr('requests_total', outcome='pool_broken')
+            self._restart_pool(pool)
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Worker process died, retry later", {'Retry-After': '1'})
+        finally:
+            self.pending -= 1
+
+        if worker_metrics is not None:
+            self.registry.merge(worker_metrics, process='worker')
+        total_ms = (time.perf_counter() - start) * 1000
+        timings['total'] = total_ms
+        # Time spent waiting for a free worker plus pickling both ways
+        timings['queue'] = max(0.0, total_ms - sum(v for k, v in timings.items() if k != 'total'))
+        for stage, ms in timings.items():
+            self.stats.record(stage, ms)
+            metrics.timing('stage_duration_ms', ms, stage=stage)
+        self.stats.counters['scored'] += 1
+        metrics.incr('requests_total', outcome='scored')
+        result['timings_ms'] = {stage: round(ms, 2) for stage, ms in timings.items()}
+        return result
+
+
+async def read_request(reader):
+    """
+    Reads one HTTP/1.1 request. Returns None when the client closed the connection.
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Incomplete request")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large")
+
+    lines = head.decode('latin-1').split('\r\n')
+    try:
+        method, target, _ = lines[0].split(' ', 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Bad Content-Length")
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Bad Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    body = await reader.readexactly(length) if length else b''
+    return method.upper(), target.split('?', 1)[0], headers, body
+
+
+async def write_response(writer, status, payload, headers=None, keep_alive=True):
+    if isinstance(payload, str):
+        body = payload.encode('utf-8')
+        content_type = "text/plain; version=0.0.4"
+    else:
+        body = json.dumps(payload).encode('utf-8')
+        content_type = "application/json"
+    status = HTTPStatus(status)
+    lines = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    await writer.drain()
+
+
+async def serve(host, port, workers, max_pending):
+    service = ScoringServer(workers, max_pending)
+    server = await service.start(host, port)
+    print(f"Skill-Sync scoring service on http://{host}:{port} ({service.workers} workers)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Skill-Sync HTTP scoring service.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="Requests allowed in flight before answering 503 (default: 32 per worker)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import json
+import re
+from collections import namedtuple
+
+_is_word_char = re.compile(r'\w').match
+
+
+def _build_trie(words):
+    root = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+    return root
+
+
+def _trie_to_regex(node):
+    """
+    Turns a character trie into a regex where shared prefixes are factored out,
+    so the engine walks one branch per character instead of trying every skill.
+    """
+    alternatives = []
+    for ch in sorted(k for k in node if k):
+        alternatives.append(re.escape(ch) + _trie_to_regex(node[ch]))
+    if not alternatives:
+        return ''
+    if len(alternatives) == 1:
+        body = alternatives[0]
+    else:
+        body = '(?:' + '|'.join(alternatives) + ')'
+    if '' in node:
+        # Greedy optional: prefer the longer skill, fall back to this one
+        return '(?:' + body + ')?'
+    return body
+
+
+class SkillIndex:
+    """
+    Compiled once, finds every skill from a list in a single pass over the text.
+    `aliases` maps alternative spellings to the canonical skill they report as.
+    """
+
+    def __init__(self, skills, aliases=None):
+        self.skills = tuple(dict.fromkeys(s for s in skills if s))
+        self.canonical = {skill: skill for skill in self.skills}
+        for alias, skill in (aliases or {}).items():
+            if alias and alias not in self.canonical:
+                self.canonical[alias] = skill
+        pattern = _trie_to_regex(_build_trie(self.canonical))
+        # Zero-width lookahead so matches starting inside another match
+        # (e.g. "learning" in "machine learning") are still reported.
+        self.pattern = re.compile(r'(?<!\w)(?=(' + pattern + r')(?!\w))')
+
+        # Shorter forms that start at the same place as a longer one
+        # ("spring" inside "spring boot") are hidden by the greedy match.
+        self.prefixes = {}
+        for form in self.canonical:
+            shorter = [
+                form[:i] for i in range(1, len(form))
+                if form[:i] in self.canonical and not (_is_word_char(form[i - 1]) and _is_word_char(form[i]))
+            ]
+            if shorter:
+                self.prefixes[form] = shorter
+
+    def finditer(self, text):
+        """
+        Yields (start, end, skill) for every skill occurrence in the text,
+        with aliases reported under their canonical skill.
+        """
+        canonical = self.canonical
+        for match in self.pattern.finditer(text):
+            form = match.group(1)
+            start = match.start(1)
+            yield start, start + len(form), canonical[form]
+            for shorter in self.prefixes.get(form, ()):
+                yield start, start + len(shorter), canonical[shorter]
+
+    def find(self, text):
+        return sorted(self.finditer(text))
+
+    def extract(self, text):
+        found = {}
+        for _, _, skill in self.finditer(text):
+            found[skill] = True
+        return list(found)
+
+
+Skill = namedtuple('Skill', 'name aliases category weight question')
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with their aliases, categories, weights and interview
+    questions, plus the compiled SkillIndex over every spelling.
+    """
+
+    def __init__(self, skills):
+        self.entries = {skill.name: skill for skill in skills}
+        self.skills = tuple(self.entries)
+        self.weights = {name: skill.weight for name, skill in self.entries.items()}
+        self.categories = {name: skill.category for name, skill in self.entries.items()}
+        self.questions = {name: skill.question for name, skill in self.entries.items() if skill.question}
+        aliases = {alias: skill.name for skill in skills for alias in skill.aliases}
+        self.index = SkillIndex(self.skills, aliases)
+
+    def weight(self, skill):
+        return self.weights.get(skill, 1.0)
+
+
+def load_taxonomy(path, normalize=None):
+    """
+    Reads a JSON list of {"name", "aliases", "category", "weight", "question"} entries.
+    Names and aliases are matched against clean_text output, so write them lowercase.
+    Pass clean_text as `normalize` to reject spellings it would rewrite, since those
+    can never match.
+    """
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    skills = []
+    for entry in entries:
+        skill = Skill(
+            name=entry['name'].lower(),
+            aliases=tuple(a.lower() for a in entry.get('aliases', ())),
+            category=entry.get('category'),
+            weight=float(entry.get('weight', 1.0)),
+            question=entry.get('question'),
+        )
+        if normalize is not None:
+            for form in (skill.name,) + skill.aliases:
+                if normalize(form) != form:
+                    raise ValueError(f"{path}: {form!r} ({skill.name}) is written as "
+                                     f"{normalize(form)!r} in cleaned text and would never match")
+        skills.append(skill)
+    return SkillTaxonomy(skills)
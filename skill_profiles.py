@@ -0,0 +1,215 @@
+"""
+Bitset skill profiles: every document's skills as a row of packed bits over a
+fixed skill vocabulary, so gaps and coverage for thousands of documents are a
+few NumPy bitwise operations instead of per-pair Python set arithmetic.
+
+    python skill_profiles.py build resume_store resume_skills.npz
+    python skill_profiles.py query resume_skills.npz --jd jd.txt --min-coverage 0.8
+"""
+import argparse
+
+import numpy as np
+
+# Set bits per byte value, for counting without unpacking
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class SkillVocabulary:
+    """
+    Fixed skill -> bit position mapping. Keep the order stable: saved profiles
+    are only meaningful with the vocabulary they were encoded with.
+    """
+
+    def __init__(self, skills, weights=None):
+        self.skills = tuple(dict.fromkeys(skills))
+        self.ids = {skill: i for i, skill in enumerate(self.skills)}
+        weights = weights or {}
+        self.weights = np.array([weights.get(s, 1.0) for s in self.skills], dtype=np.float64)
+
+    def __len__(self):
+        return len(self.skills)
+
+    @property
+    def n_bytes(self):
+        return (len(self.skills) + 7) // 8
+
+    def encode(self, skills):
+        """
+        Packs skills into one row of bits. Skills outside the vocabulary are ignored.
+        """
+        bits = np.zeros(len(self.skills), dtype=bool)
+        bits[[self.ids[s] for s in skills if s in self.ids]] = True
+        return np.packbits(bits)
+
+    def encode_many(self, skill_sets):
+        """
+        Packs an iterable of skill collections into an (n, n_bytes) uint8 matrix.
+        """
+        skill_sets = list(skill_sets)
+        rows, cols = [], []
+        for row, skills in enumerate(skill_sets):
+            for skill in skills:
+                if skill in self.ids:
+                    rows.append(row)
+                    cols.append(self.ids[skill])
+        bits = np.zeros((len(skill_sets), len(self.skills)), dtype=bool)
+        bits[rows, cols] = True
+        return np.packbits(bits, axis=1)
+
+    def unpack(self, packed):
+        """
+        Boolean matrix (or vector) of shape (..., len(vocabulary)).
+        """
+        return np.unpackbits(packed, axis=-1, count=len(self.skills)).astype(bool)
+
+    def decode(self, packed):
+        """
+        Skill names set in one packed row, in vocabulary order.
+        """
+        return [self.skills[i] for i in np.flatnonzero(self.unpack(packed))]
+
+    def weight_vector(self, must_have=None, must_have_weight=1.0):
+        if not must_have:
+            return self.weights
+        weights = self.weights.copy()
+        for skill in must_have:
+            if skill in self.ids:
+                weights[self.ids[skill]] *= must_have_weight
+        return weights
+
+
+def popcount(packed):
+    """
+    Number of skills in each packed row.
+    """
+    return _POPCOUNT[packed].sum(axis=-1, dtype=np.int64)
+
+
+def matching(profiles, target):
+    """
+    Skills each profile shares with the target, as packed rows.
+    """
+    return profiles & target
+
+
+def missing(profiles, target):
+    """
+    Target skills each profile lacks, as packed rows (target minus profile).
+    """
+    return target & ~profiles
+
+
+def coverage(profiles, target, vocabulary=None, weights=None):
+    """
+    Share of the target's skills each profile covers, 0..1 per row; NaN when the
+    target has no skills. Pass the vocabulary (and optionally a weight vector) for
+    weighted coverage, otherwise every skill counts once.
+    """
+    profiles, target = np.broadcast_arrays(np.atleast_2d(profiles), np.atleast_2d(target))
+    if vocabulary is None:
+        total = popcount(target).astype(np.float64)
+        covered = popcount(profiles & target)
+    else:
+        weights = vocabulary.weights if weights is None else weights
+        total = vocabulary.unpack(target) @ weights
+        covered = vocabulary.unpack(profiles & target) @ weights
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total > 0, covered / total, np.nan)
+
+
+class SkillProfiles:
+    """
+    Packed skill bitsets for a collection of documents, plus their ids.
+    """
+
+    def __init__(self, vocabulary, bits, ids):
+        self.vocabulary = vocabulary
+        self.bits = bits
+        self.ids = list(ids)
+
+    @classmethod
+    def build(cls, vocabulary, ids, skill_sets):
+        return cls(vocabulary, vocabulary.encode_many(skill_sets), ids)
+
+    @classmethod
+    def from_store(cls, vocabulary, store):
+        """
+        Profiles for every row of an ingest.ColumnStore, keyed by row number.
+        """
+        return cls.build(vocabulary, [str(i) for i in range(len(store))],
+                         (store.skills(i) for i in range(len(store))))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def covering(self, skills, min_coverage=0.8, weighted=False):
+        """
+        Returns [(id, coverage)] for documents covering at least min_coverage of
+        the given skills, best first.
+        """
+        target = self.vocabulary.encode(skills)
+        scores = coverage(self.bits, target, self.vocabulary if weighted else None)
+        hits = np.flatnonzero(scores >= min_coverage)
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
+        return [(self.ids[i], float(scores[i])) for i in hits]
+
+    def gaps(self, skills):
+        """
+        Packed rows of the given skills that each document is missing.
+        """
+        return missing(self.bits, self.vocabulary.encode(skills))
+
+    def save(self, path):
+        np.savez_compressed(path, bits=self.bits, ids=np.array(self.ids), skills=np.array(self.vocabulary.skills))
+
+    @classmethod
+    def load(cls, path, vocabulary):
+        """
+        Loads profiles saved with save(), re-encoding them if the saved skill order
+        differs from `vocabulary`.
+        """
+        with np.load(path) as data:
+            bits, ids, skills = data['bits'], data['ids'].tolist(), data['skills'].tolist()
+        if tuple(skills) != vocabulary.skills:
+            saved = SkillVocabulary(skills)
+            return cls.build(vocabulary, ids, (saved.decode(row) for row in bits))
+        return cls(vocabulary, bits, ids)
+
+
+def main(argv=None):
+    from ingest import ColumnStore
+    from utils import SKILL_VOCABULARY, clean_text, extract_skills
+
+    parser = argparse.ArgumentParser(description="Build or query packed skill profiles.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Encode every resume in an ingest store")
+    build.add_argument('store', help="Directory written by ingest.py")
+    build.add_argument('out', help="Output .npz file")
+
+    query = commands.add_parser('query', help="Resumes covering a share of a JD's skills")
+    query.add_argument('profiles')
+    query.add_argument('--jd', required=True, help="Path to a text file with the job description")
+    query.add_argument('--min-coverage', type=float, default=0.8)
+    query.add_argument('--weighted', action='store_true', help="Weight skills by the taxonomy weights")
+    query.add_argument('--top-k', type=int, default=20)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        profiles = SkillProfiles.from_store(SKILL_VOCABULARY, ColumnStore(args.store))
+        profiles.save(args.out)
+        print(f"Encoded {len(profiles)} profiles over {len(SKILL_VOCABULARY)} skills into {args.out}")
+        return
+
+    profiles = SkillProfiles.load(args.profiles, SKILL_VOCABULARY)
+    with open(args.jd, encoding='utf-8') as f:
+        jd_skills = extract_skills(clean_text(f.read()))
+    hits = profiles.covering(jd_skills, args.min_coverage, args.weighted)
+    print(f"{len(hits)} of {len(profiles)} resumes cover >= {args.min_coverage:.0%} of {len(jd_skills)} JD skills")
+    for rank, (resume_id, share) in enumerate(hits[:args.top_k], 1):
+        print(f"{rank:>3}. {resume_id:<30} {share:>6.1%}")
+
+
+if __name__ == '__main__':
+    main()
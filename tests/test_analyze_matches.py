@@ -0,0 +1,34 @@
+import pytest
+
+from utils import analyze_match, analyze_matches, clean_text
+
+RESUME = """Jane Doe
+Skills: Python, SQL, Docker, Kubernetes, C#.NET
+Experience: Built Django services on AWS and pandas pipelines.
+"""
+
+JDS = [
+    "Backend engineer with Python, Django, AWS and Terraform.",
+    "Data analyst: SQL, Tableau, Excel and Python.",
+    "",
+    "We value teamwork, punctuality and a positive attitude.",
+    "Senior .NET developer with C# and Azure.",
+]
+
+
+@pytest.mark.parametrize('must_have', [None, frozenset(), frozenset({'python', 'terraform', 'tableau'})])
+@pytest.mark.parametrize('resume', [RESUME, "", "Friendly and hard working."])
+def test_matches_agree_with_single_analysis(resume, must_have):
+    clean_resume = clean_text(resume)
+    clean_jds = [clean_text(jd) for jd in JDS]
+    batch = analyze_matches(resume, clean_resume, clean_jds, must_have=must_have)
+    assert len(batch) == len(JDS)
+    for clean_jd, result in zip(clean_jds, batch):
+        single = analyze_match(resume, clean_resume, clean_jd, must_have=must_have)
+        assert result['match_percentage'] == pytest.approx(single['match_percentage'], abs=0.01)
+        assert {k: v for k, v in result.items() if k != 'match_percentage'} == \
+               {k: v for k, v in single.items() if k != 'match_percentage'}
+
+
+def test_no_jds():
+    assert analyze_matches(RESUME, clean_text(RESUME), []) == []
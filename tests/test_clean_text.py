@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from utils import clean_text, extract_skills
+
+_ALPHABET = 'abcCZ019 \t\n.+#-_/,;:()&@*\'"!?'
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("C++, Python,Java", "c++ python java"),
+    ("Skills: C#, .", "skills c#"),
+    ("Node.js and Scikit-Learn.", "node.js and scikit-learn"),
+    ("see https://example.com/x for more", "see for more"),
+    ("C#.NET and (.NET Core)", "c#.net and .net core"),
+    ("wait... .5 years", "wait 5 years"),
+])
+def test_keeps_skill_symbols(text, expected):
+    assert clean_text(text) == expected
+
+
+def test_skills_survive_cleaning():
+    clean = clean_text("Languages: C++, C#, Node.js; ML with Scikit-Learn.")
+    assert {'c++', 'c#', 'node', 'scikit-learn'} <= set(extract_skills(clean))
+
+
+@pytest.mark.parametrize('text', [".NET", "C#.NET developer", "ASP.NET MVC", ".NET Core"])
+def test_dotnet_spellings(text):
+    assert 'dotnet' in extract_skills(clean_text(text))
+
+
+def test_idempotent_on_random_text():
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = ''.join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 40)))
+        once = clean_text(text)
+        assert clean_text(once) == once, repr(text)
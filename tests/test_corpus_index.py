@@ -0,0 +1,45 @@
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from corpus_index import ResumeIndex
+
+TEXTS = [
+    "python django sql backend developer",
+    "react redux typescript frontend engineer",
+    "machine learning python pandas scikit-learn",
+    "java spring boot microservices kafka",
+    "python flask aws docker kubernetes",
+    "data analyst sql tableau excel",
+]
+JD = "backend python developer with sql aws and docker"
+
+
+def test_add_matches_building_on_all_texts():
+    vectorizer = TfidfVectorizer(sublinear_tf=True).fit(TEXTS)
+    whole = ResumeIndex.build(TEXTS, vectorizer=vectorizer)
+
+    grown = ResumeIndex.build(TEXTS[:2], vectorizer=vectorizer)
+    grown.add(TEXTS[2:4], [2, 3])
+    grown.add(TEXTS[4:], [4, 5])
+
+    assert len(grown) == len(whole) == len(TEXTS)
+    grown_top, whole_top = grown.top_k(JD, k=len(TEXTS)), whole.top_k(JD, k=len(TEXTS))
+    assert [i for i, _ in grown_top] == [i for i, _ in whole_top]
+    assert [s for _, s in grown_top] == pytest.approx([s for _, s in whole_top])
+
+
+def test_top_k_is_best_first_and_bounded(tmp_path):
+    index = ResumeIndex.build(TEXTS)
+    top = index.top_k(JD, k=10)
+    assert len(top) == len(TEXTS)
+    assert top[0][0] == '0'
+    assert [score for _, score in top] == sorted((score for _, score in top), reverse=True)
+
+    index.save(str(tmp_path))
+    assert ResumeIndex.load(str(tmp_path)).top_k(JD, k=2) == index.top_k(JD, k=2)
+
+
+def test_add_rejects_mismatched_ids():
+    index = ResumeIndex.build(TEXTS[:1])
+    with pytest.raises(ValueError):
+        index.add(TEXTS[1:3], ['x'])
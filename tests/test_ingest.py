@@ -0,0 +1,32 @@
+import hashlib
+
+import pytest
+
+from ingest import ColumnStore
+
+
+def _row(text, skills=('python',)):
+    return {'raw_text': text, 'clean_text': text.lower(), 'skills': list(skills), 'category': 'Data Science',
+            'label': None, 'digest': hashlib.sha256(text.encode('utf-8')).digest()}
+
+
+def test_reopen_after_interrupted_append_drops_uncommitted_rows(tmp_path):
+    store = ColumnStore(str(tmp_path))
+    store.append([_row("First resume"), _row("Second resume", ['sql'])])
+    store.commit()
+
+    # Crash after one row reached the column files but before meta.json was written
+    crashed = ColumnStore(str(tmp_path))
+    with pytest.raises(KeyError):
+        crashed.append([_row("Lost resume", ['docker']), {'raw_text': "half a row"}])
+
+    reopened = ColumnStore(str(tmp_path))
+    assert len(reopened) == 2
+    assert reopened.raw_text(1) == "Second resume"
+
+    reopened.append([_row("Third resume", ['aws'])])
+    reopened.commit()
+    store = ColumnStore(str(tmp_path))
+    assert [row['raw_text'] for row in store.iter_rows()] == ["First resume", "Second resume", "Third resume"]
+    assert [store.skills(i) for i in range(3)] == [['python'], ['sql'], ['aws']]
+    assert store.digests() == {_row(t)['digest'] for t in ("First resume", "Second resume", "Third resume")}
@@ -0,0 +1,24 @@
+from utils import build_interview_prep, get_static_interview_prep, prep_seed
+
+SKILLS = ['docker', 'kubernetes', 'python', 'react']
+
+
+def test_same_skills_give_the_same_prep():
+    first = get_static_interview_prep(SKILLS)
+    assert get_static_interview_prep(SKILLS) == first
+    assert get_static_interview_prep(list(reversed(SKILLS))) == first
+    assert get_static_interview_prep(set(SKILLS)) == first
+
+
+def test_seed_is_stable_and_order_free():
+    assert prep_seed(SKILLS) == prep_seed(reversed(SKILLS))
+    assert build_interview_prep(SKILLS).seed == prep_seed(SKILLS)
+
+
+def test_explicit_seed_changes_the_picks():
+    default = build_interview_prep(SKILLS)
+    seeded = build_interview_prep(SKILLS, seed=0)
+    assert (seeded.behavioral, seeded.tips) != (default.behavioral, default.tips)
+    assert seeded.technical == default.technical
+    assert get_static_interview_prep(SKILLS, seed=0) == get_static_interview_prep(SKILLS, seed=0)
+    assert get_static_interview_prep(SKILLS, seed=0) != get_static_interview_prep(SKILLS, seed=1)
@@ -0,0 +1,20 @@
+from job_match import rank_jobs
+
+RESUME = "Backend developer: Python, Django, SQL, Docker and AWS. Some React on the side."
+
+JOBS = [
+    ('empty.txt', ""),
+    ('react.txt', "Frontend engineer with React, Redux, TypeScript and CSS."),
+    ('culture.txt', "We value teamwork, punctuality and a positive attitude."),
+    ('backend.txt', "Backend engineer: Python, Django, SQL, Docker, Kubernetes and AWS."),
+]
+
+
+def test_jds_without_skills_rank_last():
+    ranked = [r['id'] for r in rank_jobs(RESUME, JOBS)]
+    assert ranked[:2] == ['backend.txt', 'react.txt']
+    assert set(ranked[2:]) == {'empty.txt', 'culture.txt'}
+
+
+def test_top_k_keeps_best():
+    assert [r['id'] for r in rank_jobs(RESUME, JOBS, top_k=1)] == ['backend.txt']
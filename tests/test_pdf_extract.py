@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from bench import make_pdf
+from pdf_extract import MAX_PDF_PAGES, PDFExtractionError, extract_pdf
+
+TEXT = "Python developer with SQL and Docker experience " * 20
+
+
+def test_pages_over_the_cap_are_truncated():
+    pdf = extract_pdf(make_pdf(TEXT, MAX_PDF_PAGES + 1))
+    assert pdf.pages == MAX_PDF_PAGES
+    assert pdf.truncated == 'pages'
+
+
+def test_exactly_max_pages_is_not_truncated():
+    pdf = extract_pdf(make_pdf(TEXT, 3), max_pages=3)
+    assert pdf.pages == 3
+    assert pdf.truncated is None
+    assert 'Python developer' in pdf.text
+
+
+def test_chars_over_the_cap_are_truncated():
+    pdf = extract_pdf(make_pdf(TEXT, 2), max_chars=100)
+    assert len(pdf.text) == 100
+    assert pdf.truncated == 'chars'
+
+
+def test_file_object_input():
+    assert extract_pdf(io.BytesIO(make_pdf(TEXT, 1))).truncated is None
+
+
+@pytest.mark.parametrize('max_bytes, limit', [(100, '100 bytes'), (2048, '2 KB'), (3 * 1024 * 1024, '3 MB')])
+def test_too_large(max_bytes, limit):
+    with pytest.raises(PDFExtractionError, match=f"the {limit} limit") as e:
+        extract_pdf(b'%PDF-1.4' + b'0' * (3 * 1024 * 1024), max_bytes=max_bytes)
+    assert e.value.reason == 'too_large'
+
+
+def test_unreadable():
+    with pytest.raises(PDFExtractionError) as e:
+        extract_pdf(b'not a pdf at all')
+    assert e.value.reason == 'unreadable'
+
+
+def test_timeout():
+    with pytest.raises(PDFExtractionError) as e:
+        extract_pdf(make_pdf(TEXT, 2), timeout=-1)
+    assert e.value.reason == 'timeout'
@@ -0,0 +1,43 @@
+from resume_parser import parse_resume
+from utils import SECTION_WEIGHTS, analyze_match, clean_text, extract_features, section_skills
+
+RESUME = """Jane Doe
+jane@example.com | 555-123-4567
+TECHNICAL SKILLS
+Languages: Python, Java, SQL
+Frameworks: Django, Flask
+Training: AWS bootcamp
+WORK EXPERIENCE
+Built REST services with Django at Acme.
+Languages
+English, Hindi
+"""
+
+
+def test_sub_labels_stay_in_skills_block():
+    document = parse_resume(RESUME)
+    assert [s.name for s in document.sections] == ['header', 'skills', 'experience', 'personal']
+    assert "Languages: Python, Java, SQL" in document.section_text('skills')
+    assert document.token_counts['skills'] == 10
+    assert section_skills(document)['skills'] >= {'python', 'java', 'sql', 'django', 'flask', 'aws'}
+
+
+def test_section_weights_credit_skills_block():
+    jd = clean_text("Python, Java, SQL and Django developer")
+    result = analyze_match(RESUME, clean_text(RESUME), jd, section_weights=SECTION_WEIGHTS)
+    assert "• **Keywords:** 50.0/50 points" in result['ats_breakdown']
+
+
+def test_glued_inline_heading():
+    text = "Skills: Python\nBuilt models with deep learning.Education Details\nB.E. Computer Science"
+    document = parse_resume(text)
+    assert [(s.name, s.heading) for s in document.sections] == [
+        ('skills', 'Skills'), ('education', 'Education Details')]
+    assert document.section_text('education').strip() == "B.E. Computer Science"
+
+
+def test_features_fall_back_to_keywords_without_headings():
+    text = clean_text("We need experience with Python projects and a degree; education in CS preferred.")
+    features = extract_features(text, text)
+    assert not features.document.section_names
+    assert features.sections == {'experience', 'projects', 'education'}
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import os
+import signal
+
+import server
+
+
+async def _request(port, raw):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+def _status(response):
+    return int(response.split(b' ', 2)[1])
+
+
+def _score_body(text='Python developer'):
+    body = json.dumps({'job_description': 'Python and SQL', 'resume_text': text}).encode()
+    return (b'POST /score HTTP/1.1\r\nConnection: close\r\nContent-Length: ' + str(len(body)).encode()
+            + b'\r\n\r\n' + body)
+
+
+def _run(scenario):
+    async def main():
+        service = server.ScoringServer(workers=1)
+        tcp = await service.start('127.0.0.1', 0)
+        try:
+            return await scenario(service, tcp.sockets[0].getsockname()[1])
+        finally:
+            tcp.close()
+            service.close()
+    return asyncio.run(main())
+
+
+def test_negative_content_length_is_rejected():
+    async def scenario(service, port):
+        return await _request(port, b'POST /score HTTP/1.1\r\nContent-Length: -1\r\n\r\n')
+    assert _status(_run(scenario)) == 400
+
+
+def test_unexpected_error_returns_json_500(monkeypatch):
+    async def boom(body):
+        raise RuntimeError("boom")
+
+    async def scenario(service, port):
+        monkeypatch.setattr(service, 'score', boom)
+        return await _request(port, _score_body())
+
+    response = _run(scenario)
+    assert _status(response) == 500
+    assert json.loads(response.split(b'\r\n\r\n', 1)[1]) == {'error': "Internal server error"}
+
+
+def test_pool_is_replaced_after_a_worker_dies():
+    async def scenario(service, port):
+        assert _status(await _request(port, _score_body())) == 200
+        for pid in list(service.pool._processes):
+            os.kill(pid, signal.SIGKILL)
+        await asyncio.sleep(0.5)
+        broken = await _request(port, _score_body())
+        recovered = await _request(port, _score_body())
+        return broken, recovered
+
+    broken, recovered = _run(scenario)
+    assert _status(broken) == 503
+    assert _status(recovered) == 200
+
+
+def test_metrics_include_worker_stages():
+    async def scenario(service, port):
+        assert _status(await _request(port, _score_body())) == 200
+        return await _request(port, b'GET /metrics HTTP/1.1\r\nConnection: close\r\n\r\n')
+
+    text = _run(scenario).split(b'\r\n\r\n', 1)[1].decode()
+    assert 'skillsync_stage_duration_ms_count{process="worker",stage="skills"} ' in text
+    assert 'skillsync_stage_duration_ms_count{stage="score"} ' in text
+
+
+def test_pool_falls_back_to_spawn_without_forkserver(monkeypatch):
+    monkeypatch.setattr(server.multiprocessing, 'get_all_start_methods', lambda: ['spawn'])
+    service = server.ScoringServer(workers=1)
+    pool = service._new_pool()
+    try:
+        assert pool._mp_context.get_start_method() == 'spawn'
+        result, _, _ = pool.submit(server.score_request, 'Python and SQL', resume_text='Python developer').result()
+        assert result['matching_skills'] == ['python']
+    finally:
+        pool.shutdown()
@@ -0,0 +1,19 @@
+import json
+
+import pytest
+
+from skill_index import load_taxonomy
+from utils import TAXONOMY_PATH, clean_text
+
+
+def test_shipped_taxonomy_survives_cleaning():
+    taxonomy = load_taxonomy(TAXONOMY_PATH, normalize=clean_text)
+    assert taxonomy.index.canonical['.net'] == 'dotnet'
+
+
+def test_rejects_alias_that_cleaning_rewrites(tmp_path):
+    path = tmp_path / 'taxonomy.json'
+    path.write_text(json.dumps([{'name': 'dotnet', 'aliases': ['.net!']}]))
+    assert load_taxonomy(str(path)).skills == ('dotnet',)
+    with pytest.raises(ValueError, match="'.net!'"):
+        load_taxonomy(str(path), normalize=clean_text)
@@ -0,0 +1,42 @@
+import sqlite3
+
+from text_cache import TextCache, file_digest
+from utils import clean_text, extract_resume_text, extract_skills
+
+
+def test_cached_text_is_cleaned_on_read(tmp_path):
+    cache = TextCache(str(tmp_path / 'cache.sqlite3'))
+    data = b'%PDF-1.4 not parsed on a cache hit'
+    cache.put(file_digest(data), "C++, Python,Java")
+
+    resume_text, clean_resume, truncated = extract_resume_text(data, cache=cache)
+
+    assert resume_text == "C++, Python,Java"
+    assert truncated is None
+    assert clean_resume == clean_text(resume_text)
+    assert {'c++', 'python', 'java'} <= set(extract_skills(clean_resume))
+
+
+def test_entries_from_older_schema_are_dropped(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    # Layout written before the cache stopped storing cleaned text
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute('CREATE TABLE texts (digest TEXT PRIMARY KEY, raw_text TEXT NOT NULL, '
+                     'clean_text TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)')
+        conn.execute("INSERT INTO texts VALUES ('abc', 'C++, Python,Java', 'c pythonjava', 10, 0)")
+    conn.close()
+
+    cache = TextCache(path)
+
+    assert cache.get('abc') is None
+    cache.put('abc', 'fresh')
+    assert cache.get('abc') == ('fresh', None)
+
+
+def test_truncation_survives_the_cache(tmp_path):
+    cache = TextCache(str(tmp_path / 'cache.sqlite3'))
+    data = b'%PDF-1.4 not parsed on a cache hit'
+    cache.put(file_digest(data), 'first pages only', 'pages')
+
+    assert extract_resume_text(data, cache=cache)[2] == 'pages'
@@ -0,0 +1,111 @@
+"""
+On-disk cache of extracted resume text, keyed by the SHA-256 of the PDF bytes.
+
+Only the raw PDF text is stored. Cleaning is cheap next to PDF parsing and
+changes between releases, so callers run clean_text on every read instead of
+trusting a cleaned copy written by an older version.
+
+Backed by SQLite in WAL mode so several Streamlit sessions or batch workers
+can read and write the same cache file at once.
+"""
+import hashlib
+import os
+import sqlite3
+import time
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'SKILLSYNC_TEXT_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'skill-sync', 'text_cache.sqlite3'),
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Bump when the table layout changes; older tables are dropped on open
+SCHEMA_VERSION = 2
+
+
+def file_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class TextCache:
+    """
+    Stores the raw text per file digest, with the cap that truncated it (see
+    pdf_extract.PDFText), evicting the least recently used entries once the
+    stored text goes over max_bytes.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS texts')
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS texts ('
+                ' digest TEXT PRIMARY KEY,'
+                ' raw_text TEXT NOT NULL,'
+                ' truncated TEXT,'
+                ' size INTEGER NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS texts_lru ON texts (last_access)')
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across threads and processes
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, digest):
+        """
+        Returns (raw_text, truncated) or None.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT raw_text, truncated FROM texts WHERE digest = ?', (digest,)).fetchone()
+            if row is None:
+                return None
+            try:
+                with conn:
+                    conn.execute('UPDATE texts SET last_access = ? WHERE digest = ?', (time.time(), digest))
+            except sqlite3.OperationalError:
+                # Another writer holds the lock; a stale LRU timestamp is harmless
+                pass
+            return row
+        finally:
+            conn.close()
+
+    def put(self, digest, raw_text, truncated=None):
+        size = len(raw_text.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO texts (digest, raw_text, truncated, size, last_access) VALUES (?, ?, ?, ?, ?)',
+                    (digest, raw_text, truncated, size, time.time()),
+                )
+                self._evict(conn)
+        finally:
+            conn.close()
+
+    def _evict(self, conn):
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM texts').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for digest, size in conn.execute('SELECT digest, size FROM texts ORDER BY last_access').fetchall():
+            conn.execute('DELETE FROM texts WHERE digest = ?', (digest,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute('DELETE FROM texts')
+        finally:
+            conn.close()
@@ -0,0 +1,138 @@
+"""
+Trains the resume category classifier and exports versioned artifacts.
+
+    python train.py                       # linear model, written to artifacts/<version>/
+    python train.py --model rf --install  # random forest, also copied next to app.py
+
+Point SKILLSYNC_MODEL_DIR at a version directory to serve it without --install.
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.svm import LinearSVC
+
+import models
+from utils import clean_text
+
+CLASSIFIER_FILE = 'category_classifier.joblib'
+VECTORIZER_FILE = 'tfidf_vectorizer.joblib'
+
+
+def make_classifier(kind, seed):
+    if kind == 'linear':
+        # Multinomial logistic regression: one sparse dot product per class, and it has predict_proba
+        return LogisticRegression(C=10.0, max_iter=2000, random_state=seed)
+    if kind == 'svm':
+        return LinearSVC(C=1.0, random_state=seed)
+    if kind == 'rf':
+        return RandomForestClassifier(n_estimators=200, n_jobs=-1, random_state=seed)
+    raise ValueError(f"Unknown model kind: {kind}")
+
+
+def load_dataset(csv_path):
+    df = pd.read_csv(csv_path)
+    df['clean'] = df['Resume'].astype(str).map(clean_text)
+    # The dataset repeats most resumes; keep one copy so test rows never appear in training
+    return df.drop_duplicates('clean').reset_index(drop=True)
+
+
+def benchmark(vectorizer, clf, texts, single_runs=200):
+    """
+    Measures per-resume latency (transform + predict one document) and batch throughput.
+    """
+    latencies = []
+    for text in (texts * (single_runs // max(len(texts), 1) + 1))[:single_runs]:
+        start = time.perf_counter()
+        clf.predict(vectorizer.transform([text]))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    clf.predict(vectorizer.transform(texts))
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        'single_p50_ms': round(float(np.percentile(latencies, 50)), 3),
+        'single_p95_ms': round(float(np.percentile(latencies, 95)), 3),
+        'batch_size': len(texts),
+        'batch_resumes_per_sec': round(len(texts) / batch_seconds, 1),
+    }
+
+
+def train(csv_path, kind='linear', max_features=3000, test_size=0.2, seed=42):
+    df = load_dataset(csv_path)
+    train_df, test_df = train_test_split(df, test_size=test_size, random_state=seed, stratify=df['Category'])
+
+    vectorizer = TfidfVectorizer(max_features=max_features, stop_words='english', sublinear_tf=True)
+    x_train = vectorizer.fit_transform(train_df['clean'])
+    clf = make_classifier(kind, seed)
+    start = time.perf_counter()
+    clf.fit(x_train, train_df['Category'])
+    fit_seconds = time.perf_counter() - start
+
+    predictions = clf.predict(vectorizer.transform(test_df['clean']))
+    report = {
+        'model': kind,
+        'train_rows': len(train_df),
+        'test_rows': len(test_df),
+        'accuracy': round(float(accuracy_score(test_df['Category'], predictions)), 4),
+        'fit_seconds': round(fit_seconds, 3),
+    }
+    report.update(benchmark(vectorizer, clf, list(test_df['clean'])))
+    return vectorizer, clf, report
+
+
+def export(vectorizer, clf, report, out_dir):
+    version = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ') + '-' + report['model']
+    version_dir = os.path.join(out_dir, version)
+    os.makedirs(version_dir, exist_ok=True)
+    joblib.dump(clf, os.path.join(version_dir, CLASSIFIER_FILE))
+    joblib.dump(vectorizer, os.path.join(version_dir, VECTORIZER_FILE))
+    with open(os.path.join(version_dir, 'metadata.json'), 'w', encoding='utf-8') as f:
+        json.dump(dict(report, version=version), f, indent=2)
+    return version_dir
+
+
+def install(version_dir):
+    """
+    Copies a version's artifacts into the directory the model registry reads from.
+    """
+    for filename in (CLASSIFIER_FILE, VECTORIZER_FILE):
+        shutil.copy2(os.path.join(version_dir, filename), os.path.join(models.MODEL_DIR, filename))
+    models.reset()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train and export the resume category classifier.")
+    parser.add_argument('--data', default='data/UpdatedResumeDataSet.csv')
+    parser.add_argument('--model', choices=['linear', 'svm', 'rf'], default='linear',
+                        help="linear/svm are sparse dot products at inference; rf is much slower per resume")
+    parser.add_argument('--max-features', type=int, default=3000)
+    parser.add_argument('--out', default='artifacts')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--install', action='store_true', help="Also copy the artifacts next to app.py")
+    args = parser.parse_args(argv)
+
+    vectorizer, clf, report = train(args.data, args.model, args.max_features, seed=args.seed)
+    version_dir = export(vectorizer, clf, report, args.out)
+    if args.install:
+        install(version_dir)
+
+    print(f"Exported {version_dir}")
+    for key, value in report.items():
+        print(f"  {key:<22} {value}")
+
+
+if __name__ == '__main__':
+    main()
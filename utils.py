@@ -1,79 +1,327 @@
 import re
-import PyPDF2
-import pickle
 import random
+import os
+import hashlib
+import functools
+import sqlite3
+import numpy as np
+from collections import namedtuple
+import metrics
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from skill_index import load_taxonomy
+from models import get_model
+from pdf_extract import PDFExtractionError, extract_pdf, read_pdf_bytes
+from text_cache import TextCache, file_digest
+from resume_parser import parse_resume
+from skill_profiles import SkillVocabulary, coverage, missing, popcount
 
-# Load models if they exist
-try:
-    clf = pickle.load(open('rf_classifier.pkl', 'rb'))
-    vectorizer = pickle.load(open('tfidf_vectorizer.pkl', 'rb'))
-    MODELS_LOADED = True
-except:
-    MODELS_LOADED = False
+_TEXT_CACHE = None
 
+@metrics.timed('pdf_extract')
 def extract_text_from_pdf(uploaded_file):
+    """
+    Returns the text of the PDF, raising PDFExtractionError if it cannot be read.
+    Use extract_pdf() directly to find out whether a size cap cut the text short.
+    """
+    pdf = extract_pdf(uploaded_file)
+    if pdf.truncated:
+        metrics.incr('pdf_truncated_total', cap=pdf.truncated)
+    return pdf.text
+
+def get_text_cache():
+    global _TEXT_CACHE
+    if _TEXT_CACHE is None:
+        try:
+            _TEXT_CACHE = TextCache()
+        except (OSError, sqlite3.Error):
+            _TEXT_CACHE = False
+    return _TEXT_CACHE or None
+
+def extract_resume_text(uploaded_file, cache=None):
+    """
+    Returns (resume_text, clean_resume, truncated) for an uploaded file or a path,
+    reusing the on-disk text cache when the same PDF bytes have been parsed before.
+    truncated is None, or 'pages'/'chars' when a cap in pdf_extract cut the text short.
+    The cache holds raw text only, so cleaning always uses the current clean_text.
+    Raises PDFExtractionError if the PDF cannot be read.
+    """
     try:
-        pdf_reader = PyPDF2.PdfReader(uploaded_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    except Exception as e:
-        return str(e)
+        data = read_pdf_bytes(uploaded_file)
+    except PDFExtractionError as e:
+        metrics.incr('pdf_errors_total', reason=e.reason)
+        raise
+    metrics.observe('document_bytes', len(data))
 
+    cache = cache or get_text_cache()
+    digest = file_digest(data)
+    if cache is not None:
+        try:
+            cached = cache.get(digest)
+        except sqlite3.Error:
+            cached = None
+        metrics.incr('cache_requests_total', cache='text', result='miss' if cached is None else 'hit')
+        if cached is not None:
+            resume_text, truncated = cached
+            return resume_text, clean_text(resume_text), truncated
+
+    # Failures are never cached
+    try:
+        with metrics.timer('pdf_extract'):
+            pdf = extract_pdf(data)
+    except PDFExtractionError as e:
+        metrics.incr('pdf_errors_total', reason=e.reason)
+        raise
+    if pdf.truncated:
+        metrics.incr('pdf_truncated_total', cap=pdf.truncated)
+    if cache is not None:
+        try:
+            cache.put(digest, pdf.text, pdf.truncated)
+        except sqlite3.Error:
+            pass
+    return pdf.text, clean_text(pdf.text), pdf.truncated
+
+_URL_PATTERN = re.compile(r'http\S+')
+# Matches one punctuation character (plus any run it starts) that should become a
+# space. Symbols that belong to skill names survive: '+'/'#' trailing a word
+# (c++, c#), '.'/'-' between word characters (node.js, scikit-learn) and a single
+# '.' opening a word (.net, c#.net).
+# Leading with a plain character class lets the regex engine skip words quickly.
+_PUNCT_PATTERN = re.compile(
+    r'[^\w\s](?:'
+    r'(?<=[^.+#-])[^\w\s.+#-]*'
+    r'|(?<=[+#])(?<![\w+#].)[+#]*'
+    r'|(?<=-)(?<!\w.)'
+    r'|(?<=\.)(?<!\w.)(?:(?<=\.\.)|(?![a-z]))'
+    r'|(?<=[.-])(?!\w))'
+)
+
+@metrics.timed('clean')
 def clean_text(text):
+    """
+    Lowercases, drops URLs and punctuation, and collapses whitespace.
+    Idempotent: clean_text(clean_text(t)) == clean_text(t), so text that has
+    already been cleaned can be passed on without cleaning it again.
+    """
     text = text.lower()
-    text = re.sub(r'http\S+', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^\w\s]', '', text)
-    return text
-
-def predict_category(resume_text):
-    if not MODELS_LOADED:
-        return "General"
-    cleaned_text = clean_text(resume_text)
-    vectorized_text = vectorizer.transform([cleaned_text])
-    prediction = clf.predict(vectorized_text)[0]
-    return prediction
+    if 'http' in text:
+        text = _URL_PATTERN.sub(' ', text)
+    return ' '.join(_PUNCT_PATTERN.sub(' ', text).split())
+
+# --- SKILL TAXONOMY ---
+# Canonical skills, aliases, categories, weights and interview questions live in
+# data/skill_taxonomy.json and are compiled into one lookup once per process.
+TAXONOMY_PATH = os.environ.get(
+    'SKILLSYNC_TAXONOMY',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_taxonomy.json'),
+)
+TAXONOMY = load_taxonomy(TAXONOMY_PATH, normalize=clean_text)
+SKILLS_DB = list(TAXONOMY.skills)
+_SKILL_INDEX = TAXONOMY.index
+# Bit positions for packed skill profiles, fixed by the taxonomy file order
+SKILL_VOCABULARY = SkillVocabulary(TAXONOMY.skills, TAXONOMY.weights)
+
+# Extra weight for skills the caller marks as must-have for a JD
+MUST_HAVE_WEIGHT = 2.0
+
+@metrics.timed('similarity')
+def calculate_match_percentage(clean_resume, clean_jd):
+    """
+    Cosine similarity of the two texts, weighted by IDF learnt on the resume corpus.
+    Falls back to fitting on the pair when no corpus vectorizer is available.
+    """
+    corpus_vectorizer = get_model('vectorizer')
+    if corpus_vectorizer is not None:
+        tfidf_matrix = corpus_vectorizer.transform([clean_resume, clean_jd])
+        return round(float(tfidf_matrix[0].multiply(tfidf_matrix[1]).sum()) * 100, 2)
+
+    text_corpus = [clean_resume, clean_jd]
+    vectorizer = TfidfVectorizer()
+    tfidf_matrix = vectorizer.fit_transform(text_corpus)
+    return round(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0] * 100, 2)
+
+def calculate_match_percentages(clean_resume, clean_jds):
+    """
+    calculate_match_percentage against many JDs: the JDs are vectorised into one
+    sparse matrix and every similarity comes from a single product.
+    Without a corpus vectorizer, IDF is fitted on the resume and all the JDs together.
+    """
+    if not clean_jds:
+        return []
+    corpus_vectorizer = get_model('vectorizer')
+    if corpus_vectorizer is not None:
+        jd_matrix = corpus_vectorizer.transform(clean_jds)
+        resume_vector = corpus_vectorizer.transform([clean_resume])
+    else:
+        tfidf_matrix = TfidfVectorizer().fit_transform([clean_resume] + list(clean_jds))
+        resume_vector, jd_matrix = tfidf_matrix[0], tfidf_matrix[1:]
+    # TF-IDF rows are L2-normalised, so the dot product is the cosine similarity
+    similarities = (jd_matrix @ resume_vector.T).toarray().ravel()
+    return [round(float(s) * 100, 2) for s in similarities]
 
+def predict_category(resume_text, cleaned=False):
+    categories, _ = predict_categories([resume_text], cleaned=cleaned)
+    return categories[0]
+
+@metrics.timed('classify')
+def predict_categories(texts, cleaned=False):
+    """
+    Classifies many resumes with one transform and one predict call.
+    Returns (categories, probabilities); probabilities is an (n, n_classes) array
+    ordered like category_labels(), or None when the model has no predict_proba.
+    Pass cleaned=True for text that has already been through clean_text.
+    """
+    texts = list(texts)
+    # Models are loaded on first use; see models.py
+    clf = get_model('classifier')
+    vectorizer = get_model('vectorizer')
+    if clf is None or vectorizer is None:
+        return ["General"] * len(texts), None
+    if not texts:
+        return [], None
+    if not cleaned:
+        texts = [clean_text(t) for t in texts]
+    vectorized = vectorizer.transform(texts)
+    if hasattr(clf, 'predict_proba'):
+        probabilities = clf.predict_proba(vectorized)
+        categories = list(clf.classes_[probabilities.argmax(axis=1)])
+    else:
+        probabilities = None
+        categories = list(clf.predict(vectorized))
+    return categories, probabilities
+
+def category_labels():
+    clf = get_model('classifier')
+    return list(clf.classes_) if clf is not None else []
+
+@metrics.timed('skills')
 def extract_skills(text):
-    # EXPANDED SKILL LIST
-    skills_db = [
-        # Languages
-        'python', 'java', 'c++', 'javascript', 'typescript', 'c#', 'go', 'ruby', 'php', 'swift', 'kotlin', 'rust',
-        # Frontend
-        'html', 'css', 'react', 'angular', 'vue', 'redux', 'tailwind', 'bootstrap', 'jquery',
-        # Backend
-        'node', 'express', 'django', 'flask', 'spring boot', 'dotnet', 'rails', 'fastapi',
-        # Database
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'firebase', 'cassandra',
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'terraform', 'ansible', 'circleci',
-        # Data Science & ML
-        'machine learning', 'deep learning', 'nlp', 'computer vision', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn',
-        # Tools & Concepts
-        'agile', 'scrum', 'jira', 'tableau', 'power bi', 'excel', 'linux', 'bash', 'rest api', 'graphql', 'system design', 'microservices'
-    ]
-    
-    found_skills = set()
-    for skill in skills_db:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text):
-            found_skills.add(skill)
-    return list(found_skills)
+    return _SKILL_INDEX.extract(text)
+
+def find_skills(text):
+    """
+    Returns (start, end, skill) for every skill occurrence, in text order.
+    """
+    return _SKILL_INDEX.find(text)
+
+# --- PER-DOCUMENT FEATURES ---
+REQUIRED_SECTIONS = ["experience", "education", "skills", "projects"]
+# Only used for text with no detectable headings, e.g. a JD flattened by clean_text
+_SECTION_PATTERN = re.compile('|'.join(REQUIRED_SECTIONS), re.IGNORECASE)
+
+# How much a JD skill counts when it is only found in a given resume section;
+# sections not listed (header, personal, ...) use SECTION_WEIGHTS[None]
+SECTION_WEIGHTS = {
+    'skills': 1.0,
+    'experience': 1.0,
+    'projects': 1.0,
+    'certifications': 0.75,
+    'summary': 0.75,
+    None: 0.5,
+}
+
+DocumentFeatures = namedtuple('DocumentFeatures', 'skills has_email has_phone sections word_count document')
+
+@metrics.timed('features')
+def extract_features(text, clean=None, document=None):
+    """
+    Analyses a document once so the match, ATS and interview-prep stages can share
+    the result. Pass the already-cleaned text as `clean` to skip cleaning again,
+    and an existing parse_resume() result as `document` to skip parsing.
+    """
+    if clean is None:
+        clean = clean_text(text)
+    if document is None:
+        document = parse_resume(text)
+    sections = set(document.section_names.intersection(REQUIRED_SECTIONS))
+    if not document.section_names:
+        for match in _SECTION_PATTERN.finditer(text):
+            sections.add(match.group().lower())
+            if len(sections) == len(REQUIRED_SECTIONS):
+                break
+    return DocumentFeatures(
+        skills=frozenset(extract_skills(clean)),
+        has_email=document.email is not None,
+        has_phone=document.phone is not None,
+        sections=frozenset(sections),
+        word_count=len(text.split()),
+        document=document,
+    )
+
+def section_skills(document):
+    """
+    Maps each section name of a parsed resume to the skills found in its body.
+    """
+    found = {}
+    for name in dict.fromkeys(s.name for s in document.sections):
+        found[name] = frozenset(extract_skills(clean_text(document.section_text(name))))
+    return found
+
+def section_keyword_coverage(document, jd_skills, must_have=None, section_weights=None):
+    """
+    Like keyword_coverage, but a JD skill only earns the weight of the best
+    section it appears in, so a skill listed under Skills or Experience counts
+    more than one mentioned in passing. None when the JD names no skills.
+    """
+    section_weights = section_weights or SECTION_WEIGHTS
+    default = section_weights.get(None, 0.0)
+    credit = {}
+    for name, skills in section_skills(document).items():
+        weight = section_weights.get(name, default)
+        for skill in skills:
+            if weight > credit.get(skill, 0.0):
+                credit[skill] = weight
+    must_have = must_have or ()
+    def weight(skill):
+        return TAXONOMY.weight(skill) * (MUST_HAVE_WEIGHT if skill in must_have else 1.0)
+    total = sum(weight(s) for s in jd_skills)
+    if total <= 0:
+        return None
+    return sum(weight(s) * credit.get(s, 0.0) for s in jd_skills) / total
+
+def section_match_percentage(document, clean_jd, sections=('skills', 'experience', 'projects')):
+    """
+    TF-IDF match against the JD using only the given sections of a parsed resume.
+    """
+    return calculate_match_percentage(clean_text(document.section_text(*sections)), clean_jd)
 
-def calculate_ats_score(resume_text, missing_skills, jd_text):
+def calculate_ats_score(resume_text, missing_skills, jd_text, must_have=None):
     """
     Calculates a simulated ATS score based on common parsing rules.
     """
+    resume_features = extract_features(resume_text)
+    jd_skills = set(extract_skills(jd_text))
+    return score_ats(resume_features, len(jd_skills), len(missing_skills),
+                     keyword_coverage(jd_skills, missing_skills, must_have))
+
+def keyword_coverage(jd_skills, missing_skills, must_have=None):
+    """
+    Share of the JD's skill weight the resume covers, using taxonomy weights and
+    MUST_HAVE_WEIGHT for skills in must_have. None when the JD names no skills.
+    """
+    must_have = must_have or ()
+    def weight(skill):
+        return TAXONOMY.weight(skill) * (MUST_HAVE_WEIGHT if skill in must_have else 1.0)
+    total = sum(weight(s) for s in jd_skills)
+    if total <= 0:
+        return None
+    missing = sum(weight(s) for s in missing_skills if s in jd_skills)
+    return (total - missing) / total
+
+@metrics.timed('ats')
+def score_ats(resume_features, total_jd_keywords, missing_count, keyword_ratio=None):
+    """
+    ATS score and breakdown from a precomputed DocumentFeatures record.
+    keyword_ratio overrides the unweighted matched/total keyword ratio.
+    """
     score = 0
     breakdown = []
     
     # 1. KEYWORD MATCHING (50 points)
-    total_jd_keywords = len(set(extract_skills(jd_text)))
     if total_jd_keywords > 0:
-        missing_count = len(missing_skills)
-        match_ratio = (total_jd_keywords - missing_count) / total_jd_keywords
-        keyword_score = round(match_ratio * 50, 1)
+        if keyword_ratio is None:
+            keyword_ratio = (total_jd_keywords - missing_count) / total_jd_keywords
+        keyword_score = round(keyword_ratio * 50, 1)
     else:
         keyword_score = 50
     score += keyword_score
@@ -81,15 +329,13 @@ def calculate_ats_score(resume_text, missing_skills, jd_text):
 
     # 2. CONTACT INFO CHECK (20 points)
     contact_score = 0
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    if re.search(email_pattern, resume_text):
+    if resume_features.has_email:
         contact_score += 10
         breakdown.append("• **Email:** Found (+10 pts)")
     else:
         breakdown.append("• **Email:** ❌ Not detected")
 
-    phone_pattern = r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}'
-    if re.search(phone_pattern, resume_text):
+    if resume_features.has_phone:
         contact_score += 10
         breakdown.append("• **Phone:** Found (+10 pts)")
     else:
@@ -97,23 +343,16 @@ def calculate_ats_score(resume_text, missing_skills, jd_text):
     score += contact_score
 
     # 3. SECTION HEADERS CHECK (20 points)
-    section_score = 0
-    required_sections = ["experience", "education", "skills", "projects"]
-    found_sections = []
-    lower_text = resume_text.lower()
-    for sec in required_sections:
-        if sec in lower_text:
-            found_sections.append(sec.title())
-            section_score += 5
-    score += section_score
-    missing_sections = set([s.title() for s in required_sections]) - set(found_sections)
-    if len(found_sections) == 4:
+    found_sections = [sec.title() for sec in REQUIRED_SECTIONS if sec in resume_features.sections]
+    missing_sections = [sec.title() for sec in REQUIRED_SECTIONS if sec not in resume_features.sections]
+    score += 5 * len(found_sections)
+    if not missing_sections:
         breakdown.append(f"• **Sections:** All essential sections found (+20 pts)")
     else:
         breakdown.append(f"• **Sections:** Found {len(found_sections)}/4. Missing: {', '.join(missing_sections)}")
 
     # 4. LENGTH CHECK (10 points)
-    word_count = len(resume_text.split())
+    word_count = resume_features.word_count
     length_score = 0
     if 300 <= word_count <= 1200:
         length_score = 10
@@ -124,159 +363,193 @@ def calculate_ats_score(resume_text, missing_skills, jd_text):
     
     return round(score), breakdown
 
-def get_static_interview_prep(missing_skills):
+def analyze_match(resume_text, clean_resume, clean_jd, jd_features=None, resume_features=None, must_have=None,
+                  section_weights=None):
     """
-    Returns interview questions from a MASSIVE database based on missing skills.
+    Scores one resume against one JD. Pass precomputed features (see extract_features)
+    to avoid re-analysing a document, e.g. the same JD across many resumes.
+    Skills in must_have count MUST_HAVE_WEIGHT times towards the keyword score.
+    With section_weights (see SECTION_WEIGHTS) the keyword score also depends on
+    which resume sections the skills appear in.
     """
-    
-    # --- TECHNICAL QUESTION BANK ---
-    question_bank = {
-        # Languages
-        "python": "Explain the difference between deep copy and shallow copy. What are decorators?",
-        "java": "Explain the difference between JDK, JRE, and JVM. How does Garbage Collection work?",
-        "c++": "What are virtual functions? Explain the difference between pointers and references.",
-        "javascript": "Explain Closures and Hoisting. What is the difference between '==' and '==='?",
-        "typescript": "What are Interfaces vs Types? How do you handle generics in TypeScript?",
-        "c#": "What is the difference between ref and out parameters? Explain Boxing and Unboxing.",
-        "go": "What are Goroutines? Explain the difference between arrays and slices.",
-        "ruby": "What is a Gem? Explain the difference between Proc and Lambda.",
-        "php": "What are the superglobal variables in PHP? Explain strict types.",
-        "swift": "What are Optionals? Explain the difference between struct and class in Swift.",
-
-        # Frontend
-        "html": "What are semantic tags? Explain the difference between localStorage, sessionStorage, and cookies.",
-        "css": "Explain the Box Model. What is the difference between Flexbox and Grid?",
-        "react": "What are the rules of Hooks? Explain the useEffect dependency array and React Fiber.",
-        "angular": "What is Dependency Injection? Explain the difference between Observables and Promises.",
-        "vue": "Explain the Vue lifecycle. What is the difference between v-show and v-if?",
-        "redux": "Explain the Redux data flow. What are Actions and Reducers?",
-        "tailwind": "What are the benefits of utility-first CSS? How do you configure a custom theme?",
-
-        # Backend
-        "node": "Explain the Event Loop. What is the difference between process.nextTick() and setImmediate()?",
-        "express": "What is Middleware in Express? How do you handle error handling globally?",
-        "django": "Explain the MVT architecture. What is the purpose of migrations?",
-        "flask": "What is a Blueprint in Flask? How do you handle request contexts?",
-        "spring boot": "What is Auto-configuration? Explain the @SpringBootApplication annotation.",
-        "rest api": "What are the idempotent HTTP methods? Explain status codes 401 vs 403.",
-        "graphql": "What is the difference between Query and Mutation? How do you solve the N+1 problem?",
-
-        # Database
-        "sql": "Write a query to find duplicates in a table. Explain Indexing and Normalization.",
-        "postgresql": "What is MVCC? Explain the difference between JSON and JSONB types.",
-        "mongodb": "What is the Aggregation Framework? Explain Sharding vs Replication.",
-        "redis": "What are the common data types in Redis? How is it used for Caching?",
-
-        # Cloud & DevOps
-        "aws": "Explain the difference between S3, EBS, and EFS. What is a VPC?",
-        "azure": "What is an Azure Resource Manager template? Explain Blob Storage.",
-        "docker": "Explain the difference between ENTRYPOINT and CMD. What is a Docker Volume?",
-        "kubernetes": "What is a Pod? Explain the difference between a Deployment and a StatefulSet.",
-        "jenkins": "How do you create a Multibranch Pipeline? What are Jenkins shared libraries?",
-        "git": "Explain 'git rebase' vs 'git merge'. How do you resolve a merge conflict?",
-        "terraform": "What is State in Terraform? Explain 'terraform plan' vs 'terraform apply'.",
-
-        # Data & ML
-        "machine learning": "Explain the Bias-Variance tradeoff. What is Cross-Validation?",
-        "deep learning": "What is Backpropagation? Explain the Vanishing Gradient problem.",
-        "nlp": "What is Tokenization? Explain Word Embeddings (Word2Vec/GloVe).",
-        "pandas": "How do you handle missing data? Explain the difference between loc and iloc.",
-        "tensorflow": "What are Tensors? Explain the difference between Sequential and Functional APIs.",
-        "scikit-learn": "What is a Pipeline? How do you perform hyperparameter tuning using GridSearch?",
-
-        # General / Tools
-        "system design": "Design a URL shortener (like Bit.ly). How would you handle scaling?",
-        "agile": "What are the ceremonies in Scrum? Explain the difference between Kanban and Scrum.",
-        "microservices": "What are the advantages of Microservices? How do services communicate?",
-        "linux": "What is the difference between 'grep', 'awk', and 'sed'? Check process usage with 'top'.",
-        "excel": "Explain VLOOKUP vs INDEX-MATCH. How do you create a Pivot Table?"
+    if resume_features is None:
+        resume_features = extract_features(resume_text, clean_resume)
+    if jd_features is None:
+        jd_features = extract_features(clean_jd, clean_jd)
+    metrics.observe('document_words', resume_features.word_count)
+    missing_skills = sorted(jd_features.skills - resume_features.skills)
+    matching_skills = sorted(resume_features.skills & jd_features.skills)
+    if section_weights:
+        keyword_ratio = section_keyword_coverage(
+            resume_features.document, jd_features.skills, must_have, section_weights)
+    else:
+        keyword_ratio = keyword_coverage(jd_features.skills, missing_skills, must_have)
+    ats_score, ats_breakdown = score_ats(
+        resume_features, len(jd_features.skills), len(missing_skills), keyword_ratio)
+    return {
+        'match_percentage': calculate_match_percentage(clean_resume, clean_jd),
+        'ats_score': ats_score,
+        'ats_breakdown': ats_breakdown,
+        'matching_skills': matching_skills,
+        'missing_skills': missing_skills,
     }
 
-    advice = "### 🎓 Customized Interview Prep\n\n"
-    
+def analyze_matches(resume_text, clean_resume, clean_jds, jd_features=None, resume_features=None, must_have=None):
+    """
+    analyze_match for one resume against many JDs, returned in JD order. The
+    resume is analysed once, the similarities come from one matrix product and
+    the skill gaps from bitwise operations over packed skill profiles, so each
+    extra JD mostly costs its own skill extraction.
+    """
+    if resume_features is None:
+        resume_features = extract_features(resume_text, clean_resume)
+    if jd_features is None:
+        jd_features = [extract_features(clean_jd, clean_jd) for clean_jd in clean_jds]
+    if not jd_features:
+        return []
+    resume_bits = SKILL_VOCABULARY.encode(resume_features.skills)
+    jd_bits = SKILL_VOCABULARY.encode_many(features.skills for features in jd_features)
+    gap_bits = missing(resume_bits, jd_bits)
+    jd_counts = popcount(jd_bits)
+    gap_counts = popcount(gap_bits)
+    ratios = coverage(resume_bits, jd_bits, SKILL_VOCABULARY,
+                      SKILL_VOCABULARY.weight_vector(must_have, MUST_HAVE_WEIGHT))
+
+    results = []
+    similarities = calculate_match_percentages(clean_resume, clean_jds)
+    for i, match_percentage in enumerate(similarities):
+        ratio = None if np.isnan(ratios[i]) else float(ratios[i])
+        ats_score, ats_breakdown = score_ats(resume_features, int(jd_counts[i]), int(gap_counts[i]), ratio)
+        results.append({
+            'match_percentage': match_percentage,
+            'ats_score': ats_score,
+            'ats_breakdown': ats_breakdown,
+            'matching_skills': sorted(SKILL_VOCABULARY.decode(jd_bits[i] & resume_bits)),
+            'missing_skills': sorted(SKILL_VOCABULARY.decode(gap_bits[i])),
+        })
+    return results
+
+# --- INTERVIEW PREP BANKS ---
+BEHAVIORAL_BANK = (
+    "Tell me about a time you had a conflict with a coworker. How did you resolve it?",
+    "Describe a situation where you had to meet a tight deadline. How did you prioritize?",
+    "Tell me about a time you failed. What did you learn from it?",
+    "Describe a complex problem you solved. What was your thought process?",
+    "How do you handle constructive criticism?",
+    "Tell me about a time you showed leadership skills.",
+    "Why do you want to work for this specific role/industry?",
+    "Describe a time you had to learn a new technology quickly.",
+    "Tell me about a time you disagreed with a supervisor's decision.",
+    "Describe a time you went above and beyond for a project.",
+    "How do you handle working with a difficult client or stakeholder?",
+    "Tell me about a mistake you made. How did you fix it?",
+    "Describe a time you had to persuade others to your way of thinking.",
+    "How do you stay organized when you have multiple projects?",
+    "Tell me about a time you had to adapt to a significant change at work.",
+    "Describe a time you mentored a junior team member.",
+    "What is your proudest professional achievement?",
+    "Tell me about a time you identified a process inefficiency and fixed it.",
+    "How do you maintain motivation during repetitive tasks?",
+    "Describe a time you had to deliver bad news to a team or client.",
+)
+
+STRATEGIC_TIPS_BANK = (
+    "**The 'So What?' Test:** For every answer, explain the impact. Don't just say what you did; say why it mattered to the business.",
+    "**Body Language:** Maintain eye contact (even on Zoom, look at the camera). Keep your hands visible to build trust.",
+    "**The Reverse Interview:** Ask them: 'What is the biggest challenge the team is facing right now?' It shows you care about solving problems.",
+    "**STAR Method:** Always structure behavioral answers with Situation, Task, Action, and Result.",
+    "**Research Competitors:** Mentioning a competitor's recent move shows you understand the market landscape.",
+    "**Silence is Okay:** It's better to pause for 5 seconds to think than to ramble for 2 minutes.",
+    "**Quantify Results:** Use numbers wherever possible (e.g., 'Improved load time by 20%', 'Managed a budget of $50k').",
+    "**The 'Weakness' Question:** Choose a real weakness but explain the specific steps you are taking to improve it.",
+    "**Cultural Fit:** specific Use keywords from their 'About Us' page (e.g., 'Innovation', 'Customer Obsession') in your answers.",
+    "**First 5 Minutes:** The impression is often made in the intro. Have a polished 'Tell me about yourself' pitch ready.",
+    "**Technical Clarity:** If you don't know a technical answer, explain how you would find out (e.g., 'I would check the documentation for X').",
+    "**Post-Interview Note:** Send a thank-you email within 24 hours referencing a specific topic you discussed.",
+    "**Mock Interviews:** Record yourself answering common questions to catch filler words like 'um' and 'like'.",
+    "**Salary Negotiation:** Don't give a number first. Ask for the budget range for the role.",
+    "**LinkedIn Alignment:** Ensure your resume dates and titles match your LinkedIn profile exactly.",
+    "**Github Readme:** If sharing code, ensure your repositories have a README explaining what the project does and how to run it.",
+    "**Soft Skills:** Highlight communication and teamwork, not just coding. Engineering is a team sport.",
+    "**Ask About Success:** Ask 'What does success look like in this role for the first 90 days?'",
+    "**Handling Stress:** Be ready to explain your personal strategies for managing burnout and tight deadlines.",
+    "**Continuous Learning:** Mention a podcast, book, or course you are currently consuming to show you stay updated.",
+)
+
+# (missing skills that trigger it, tip); the first match wins
+FOCUS_TIPS = (
+    (frozenset(['react', 'angular', 'vue', 'html', 'css']),
+     "**Frontend Specific:** Ensure your GitHub links are working and your portfolio site is mobile-responsive."),
+    (frozenset(['machine learning', 'pandas', 'sql']),
+     "**Data Specific:** Don't just show numbers. Explain *why* the data matters to the business decision."),
+    (frozenset(['aws', 'docker', 'kubernetes']),
+     "**Cloud Specific:** Be ready to draw system architecture diagrams on a whiteboard."),
+)
+
+MAX_TECHNICAL_QUESTIONS = 5
+
+InterviewPrep = namedtuple('InterviewPrep', 'technical behavioral tips focus_tip seed')
+
+def prep_seed(missing_skills):
+    """
+    Stable seed for a set of missing skills, the same in every process.
+    """
+    digest = hashlib.sha256('\n'.join(sorted(missing_skills)).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+def build_interview_prep(missing_skills, seed=None):
+    """
+    Picks technical questions for the gaps plus behavioural questions and tips.
+    The same skills (and seed) always give the same InterviewPrep, in any order.
+    """
+    missing_skills = tuple(sorted(set(missing_skills)))
+    if seed is None:
+        seed = prep_seed(missing_skills)
+    return _build_interview_prep(missing_skills, seed)
+
+@functools.lru_cache(maxsize=4096)
+def _build_interview_prep(missing_skills, seed):
+    question_bank = TAXONOMY.questions
+    technical = tuple(
+        (skill, question_bank[skill]) for skill in missing_skills if skill in question_bank
+    )[:MAX_TECHNICAL_QUESTIONS]
+    rng = random.Random(seed)
+    behavioral = tuple(rng.sample(BEHAVIORAL_BANK, 3))
+    tips = tuple(rng.sample(STRATEGIC_TIPS_BANK, 3))
+    missing = set(missing_skills)
+    focus_tip = next((tip for trigger, tip in FOCUS_TIPS if trigger & missing), None)
+    return InterviewPrep(technical, behavioral, tips, focus_tip, seed)
+
+def render_interview_prep(prep, missing_skills):
+    """
+    Renders an InterviewPrep as markdown.
+    """
+    lines = ["### 🎓 Customized Interview Prep", ""]
+
     # 1. TECHNICAL QUESTIONS
     if missing_skills:
-        advice += "**1. Targeted Technical Questions (Based on your gaps):**\n"
-        count = 0
-        for skill in missing_skills:
-            if skill in question_bank:
-                advice += f"- **{skill.title()}:** {question_bank[skill]}\n"
-                count += 1
-            if count >= 5: 
-                break
-        
-        if count == 0:
-             advice += "- **General:** Since your gaps are niche, focus on the fundamentals of the job description's core domain.\n"
+        lines.append("**1. Targeted Technical Questions (Based on your gaps):**")
+        lines.extend(f"- **{skill.title()}:** {question}" for skill, question in prep.technical)
+        if not prep.technical:
+            lines.append("- **General:** Since your gaps are niche, focus on the fundamentals of the job description's core domain.")
     else:
-        advice += "**1. Technical Questions:**\n- Your skills match perfectly! Expect advanced system design, architecture, or behavioral questions.\n"
-
-    # --- 2. EXTENSIVE BEHAVIORAL BANK (20 Questions) ---
-    behavioral_bank = [
-        "Tell me about a time you had a conflict with a coworker. How did you resolve it?",
-        "Describe a situation where you had to meet a tight deadline. How did you prioritize?",
-        "Tell me about a time you failed. What did you learn from it?",
-        "Describe a complex problem you solved. What was your thought process?",
-        "How do you handle constructive criticism?",
-        "Tell me about a time you showed leadership skills.",
-        "Why do you want to work for this specific role/industry?",
-        "Describe a time you had to learn a new technology quickly.",
-        "Tell me about a time you disagreed with a supervisor's decision.",
-        "Describe a time you went above and beyond for a project.",
-        "How do you handle working with a difficult client or stakeholder?",
-        "Tell me about a mistake you made. How did you fix it?",
-        "Describe a time you had to persuade others to your way of thinking.",
-        "How do you stay organized when you have multiple projects?",
-        "Tell me about a time you had to adapt to a significant change at work.",
-        "Describe a time you mentored a junior team member.",
-        "What is your proudest professional achievement?",
-        "Tell me about a time you identified a process inefficiency and fixed it.",
-        "How do you maintain motivation during repetitive tasks?",
-        "Describe a time you had to deliver bad news to a team or client."
-    ]
-    # Pick 3 random behavioral questions
-    selected_behavioral = random.sample(behavioral_bank, 3)
-    
-    advice += "\n**2. Behavioral Questions (Practice these):**\n"
-    for q in selected_behavioral:
-        advice += f"- {q}\n"
-
-    # --- 3. EXTENSIVE STRATEGIC TIPS BANK (20 Tips) ---
-    strategic_tips_bank = [
-        "**The 'So What?' Test:** For every answer, explain the impact. Don't just say what you did; say why it mattered to the business.",
-        "**Body Language:** Maintain eye contact (even on Zoom, look at the camera). Keep your hands visible to build trust.",
-        "**The Reverse Interview:** Ask them: 'What is the biggest challenge the team is facing right now?' It shows you care about solving problems.",
-        "**STAR Method:** Always structure behavioral answers with Situation, Task, Action, and Result.",
-        "**Research Competitors:** Mentioning a competitor's recent move shows you understand the market landscape.",
-        "**Silence is Okay:** It's better to pause for 5 seconds to think than to ramble for 2 minutes.",
-        "**Quantify Results:** Use numbers wherever possible (e.g., 'Improved load time by 20%', 'Managed a budget of $50k').",
-        "**The 'Weakness' Question:** Choose a real weakness but explain the specific steps you are taking to improve it.",
-        "**Cultural Fit:** specific Use keywords from their 'About Us' page (e.g., 'Innovation', 'Customer Obsession') in your answers.",
-        "**First 5 Minutes:** The impression is often made in the intro. Have a polished 'Tell me about yourself' pitch ready.",
-        "**Technical Clarity:** If you don't know a technical answer, explain how you would find out (e.g., 'I would check the documentation for X').",
-        "**Post-Interview Note:** Send a thank-you email within 24 hours referencing a specific topic you discussed.",
-        "**Mock Interviews:** Record yourself answering common questions to catch filler words like 'um' and 'like'.",
-        "**Salary Negotiation:** Don't give a number first. Ask for the budget range for the role.",
-        "**LinkedIn Alignment:** Ensure your resume dates and titles match your LinkedIn profile exactly.",
-        "**Github Readme:** If sharing code, ensure your repositories have a README explaining what the project does and how to run it.",
-        "**Soft Skills:** Highlight communication and teamwork, not just coding. Engineering is a team sport.",
-        "**Ask About Success:** Ask 'What does success look like in this role for the first 90 days?'",
-        "**Handling Stress:** Be ready to explain your personal strategies for managing burnout and tight deadlines.",
-        "**Continuous Learning:** Mention a podcast, book, or course you are currently consuming to show you stay updated."
-    ]
-    
-    # Pick 3 random strategic tips
-    selected_tips = random.sample(strategic_tips_bank, 3)
-
-    advice += "\n**3. Strategic Tips:**\n"
-    for tip in selected_tips:
-        advice += f"- {tip}\n"
-
-    # Specific Tip Logic (keeps specific advice relevant)
-    if any(s in missing_skills for s in ['react', 'angular', 'vue', 'html', 'css']):
-        advice += "- **Frontend Specific:** Ensure your GitHub links are working and your portfolio site is mobile-responsive.\n"
-    elif any(s in missing_skills for s in ['machine learning', 'pandas', 'sql']):
-        advice += "- **Data Specific:** Don't just show numbers. Explain *why* the data matters to the business decision.\n"
-    elif any(s in missing_skills for s in ['aws', 'docker', 'kubernetes']):
-        advice += "- **Cloud Specific:** Be ready to draw system architecture diagrams on a whiteboard.\n"
-
-    return advice
\ No newline at end of file
+        lines.append("**1. Technical Questions:**")
+        lines.append("- Your skills match perfectly! Expect advanced system design, architecture, or behavioral questions.")
+
+    # 2. BEHAVIORAL QUESTIONS
+    lines.extend(["", "**2. Behavioral Questions (Practice these):**"])
+    lines.extend(f"- {q}" for q in prep.behavioral)
+
+    # 3. STRATEGIC TIPS
+    lines.extend(["", "**3. Strategic Tips:**"])
+    lines.extend(f"- {tip}" for tip in prep.tips)
+    if prep.focus_tip:
+        lines.append(f"- {prep.focus_tip}")
+    return '\n'.join(lines) + '\n'
+
+def get_static_interview_prep(missing_skills, seed=None):
+    """
+    Returns interview questions from a MASSIVE database based on missing skills.
+    """
+    missing_skills = tuple(missing_skills)
+    return render_interview_prep(build_interview_prep(missing_skills, seed), missing_skills)